@@ -1,17 +1,18 @@
 import os
 import json
 import shutil
-from typing import List
+import hashlib
+from typing import List, Optional
 from fastapi import Depends
 from pydantic import BaseModel
 from .agent import agent_executor
 from sqlalchemy.orm import Session
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.encoders import jsonable_encoder
 from .database import get_db, DBChat, DBMessage
 from fastapi.middleware.cors import CORSMiddleware
 from .vector_database import get_vector_db, process_files
-from fastapi import FastAPI, File, UploadFile, Form,HTTPException,status
+from fastapi import FastAPI, File, UploadFile, Form,HTTPException,status, Request
 from dotenv import load_dotenv
 
 load_dotenv(os.path.join(os.path.dirname(__file__), ".env")) # Load environment variables from .env file
@@ -51,11 +52,28 @@ class Message(BaseModel):
     def dict(self):
         return {"id": self.id, "type": self.type, "body": self.body}
 
+class BulkChatOperations(BaseModel):
+    create: List[str] = []  # names of chats to create
+    rename: List[dict] = []  # {"chat_id": ..., "name": ...}
+    delete: List[int] = []
+
 @app.get("/api/chats/", response_model=List[Chat])
-async def get_chats(db: Session = Depends(get_db)):
-    chats = db.query(DBChat).all()
+async def get_chats(request: Request, limit: Optional[int] = None, db: Session = Depends(get_db)):
+    query = db.query(DBChat)
+    if limit is None:
+        chats = query.all()
+        total = len(chats)
+    else:
+        chats = query.limit(limit).all()
+        total = query.count()
     chats_serialized = jsonable_encoder(chats)
-    return JSONResponse(content=chats_serialized)
+    response = JSONResponse(content=chats_serialized, headers={"X-Total-Count": str(total)})
+    # Content hash as ETag, so clients can revalidate the list with If-None-Match
+    etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "X-Total-Count": str(total)})
+    response.headers["ETag"] = etag
+    return response
 
 # new chat
 @app.post("/api/chats/new/")
@@ -91,28 +109,69 @@ async def rename_chat(chat_id: int, payload: dict, db: Session = Depends(get_db)
     return JSONResponse(content={"detail": "Chat renamed successfully."})
 
 
-@app.delete("/api/chats/{chat_id}/delete")
-async def delete_chat(chat_id: int, db: Session = Depends(get_db)):
-    # Find the chat
-    chat = db.query(DBChat).filter(DBChat.id == chat_id).first()
-    if not chat:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chat not found")
-    
+def remove_chat(chat: DBChat, db: Session):
     # Delete associated messages first to maintain referential integrity
-    db.query(DBMessage).filter(DBMessage.chat_id == chat_id).delete()
+    db.query(DBMessage).filter(DBMessage.chat_id == chat.id).delete()
     
     # Delete the chat
     db.delete(chat)
     db.commit()
     
     # Delete files in the chat folder if they exist
-    chat_folder = os.path.join(UPLOAD_FOLDER, str(chat_id))
+    chat_folder = os.path.join(UPLOAD_FOLDER, str(chat.id))
     if os.path.exists(chat_folder):
         shutil.rmtree(chat_folder)
+
+
+@app.delete("/api/chats/{chat_id}/delete")
+async def delete_chat(chat_id: int, db: Session = Depends(get_db)):
+    # Find the chat
+    chat = db.query(DBChat).filter(DBChat.id == chat_id).first()
+    if not chat:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Chat not found")
+    
+    remove_chat(chat, db)
     
     return JSONResponse(content={"detail": "Chat deleted successfully."})
 
 
+# bulk create/rename/delete for test fixtures, only when ENABLE_TEST_FIXTURES=true
+@app.post("/api/chats/_bulk/")
+async def bulk_chat_operations(payload: BulkChatOperations, db: Session = Depends(get_db)):
+    if os.getenv("ENABLE_TEST_FIXTURES", "false").lower() != "true":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    
+    results = {"create": [], "rename": [], "delete": []}
+    
+    for name in payload.create:
+        new_chat = DBChat(name=name or "New Chat")
+        db.add(new_chat)
+        db.commit()
+        db.refresh(new_chat)
+        results["create"].append({"status": status.HTTP_200_OK, "chat_id": new_chat.id})
+    
+    for item in payload.rename:
+        chat = db.query(DBChat).filter(DBChat.id == item.get("chat_id")).first()
+        if not chat:
+            results["rename"].append({"status": status.HTTP_404_NOT_FOUND, "chat_id": item.get("chat_id")})
+        elif not item.get("name"):
+            results["rename"].append({"status": status.HTTP_400_BAD_REQUEST, "chat_id": chat.id})
+        else:
+            chat.name = item["name"]
+            db.commit()
+            results["rename"].append({"status": status.HTTP_200_OK, "chat_id": chat.id})
+    
+    for chat_id in payload.delete:
+        chat = db.query(DBChat).filter(DBChat.id == chat_id).first()
+        if not chat:
+            results["delete"].append({"status": status.HTTP_404_NOT_FOUND, "chat_id": chat_id})
+        else:
+            remove_chat(chat, db)
+            results["delete"].append({"status": status.HTTP_200_OK, "chat_id": chat_id})
+    
+    return JSONResponse(content=results)
+
+
 @app.post("/api/chats/{chat_id}/send/")
 async def send_chat_message(
     chat_id: str, 
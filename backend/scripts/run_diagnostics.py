@@ -14,12 +14,32 @@ Requirements:
 """
 
 import os
+import io
 import sys
+import json
+import runpy
+import hashlib
+import py_compile
 import argparse
+import importlib
+import importlib.util
+import contextlib
 import subprocess
 import time
+import traceback
+import multiprocessing
+import multiprocessing.connection
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Optional
+
+# Third-party modules shared by the diagnostic scripts; importing them in the
+# parent before the pool forks means workers inherit them already loaded.
+PRELOAD_MODULES = ["requests"]
+
+# Successful script results are cached here when --cache is used
+CACHE_DIR = Path.home() / ".cache" / "rag_diag"
 
 # Color codes for terminal output
 class Colors:
@@ -32,33 +52,178 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+class PlainColors(Colors):
+    """Empty color codes for output that is not a terminal."""
+    GREEN = RED = YELLOW = BLUE = PURPLE = CYAN = BOLD = END = ''
+
+@dataclass(slots=True)
+class TestOutcome:
+    """Outcome of a single diagnostic step."""
+    success: bool
+    duration: float
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class Aggregate:
+    """Running pass/fail counters over the diagnostic steps."""
+    success: int = 0
+    total: int = 0
+    per_test: Dict[str, TestOutcome] = field(default_factory=dict)
+    
+    def record(self, test_name: str, result: dict):
+        """Add a step result, replacing any earlier result for the same step."""
+        previous = self.per_test.get(test_name)
+        if previous is not None:
+            self.total -= 1
+            self.success -= previous.success
+        
+        outcome = TestOutcome(
+            success=result["success"],
+            duration=result.get("duration") or 0.0,
+            error=result.get("error")
+        )
+        self.per_test[test_name] = outcome
+        self.total += 1
+        self.success += outcome.success
+    
+    @property
+    def success_rate(self) -> float:
+        return (self.success / self.total * 100) if self.total > 0 else 0
+
+def _run_script_in_worker(script_path: str, args: list, cwd: str) -> dict:
+    """Execute a diagnostic script as __main__ inside a forked child process."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    saved_argv = sys.argv
+    sys.argv = [script_path] + list(args)
+    sys.path.insert(0, os.path.dirname(script_path))
+    
+    start_time = time.time()
+    try:
+        os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=sys.stderr)
+                    exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path.pop(0)
+    duration = time.time() - start_time
+    
+    return {
+        "success": exit_code == 0,
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "duration": duration,
+        "command": ' '.join([sys.executable, script_path] + list(args))
+    }
+
+def _run_script_in_child(conn, script_path: str, args: list, cwd: str):
+    """Process target: run one diagnostic script and send its result through conn."""
+    conn.send(_run_script_in_worker(script_path, args, cwd))
+    conn.close()
+
 class DiagnosticRunner:
     """Unified diagnostic script runner."""
     
-    def __init__(self, backend_url=None, verbose=False):
+    def __init__(self, backend_url=None, verbose=False, parallel=False, total_timeout=None,
+                 cache_ttl=None):
         self.backend_url = backend_url
         self.verbose = verbose
+        self.parallel = parallel
+        self.cache_ttl = cache_ttl
+        # Shared budget across all scripts; later scripts get whatever the earlier ones left
+        self.deadline = time.monotonic() + total_timeout if total_timeout else None
         self.scripts_dir = Path(__file__).parent
+        self.colors = Colors if sys.stdout.isatty() else PlainColors
         self.results = {}
+        self.aggregate = Aggregate()
+        self._prefetched = {}
+        # Resolved once; the quick and full suites both use it up to three times
+        self.validation_script = self._validation_script()
     
     def log(self, message: str, level: str = "INFO"):
         """Log a message with color coding."""
         timestamp = datetime.now().strftime("%H:%M:%S")
+        c = self.colors
         if level == "SUCCESS":
-            print(f"{Colors.GREEN}[{timestamp}] ✅ {message}{Colors.END}")
+            print(f"{c.GREEN}[{timestamp}] ✅ {message}{c.END}")
         elif level == "ERROR":
-            print(f"{Colors.RED}[{timestamp}] ❌ {message}{Colors.END}")
+            print(f"{c.RED}[{timestamp}] ❌ {message}{c.END}")
         elif level == "WARNING":
-            print(f"{Colors.YELLOW}[{timestamp}] ⚠️  {message}{Colors.END}")
+            print(f"{c.YELLOW}[{timestamp}] ⚠️  {message}{c.END}")
         elif level == "INFO":
-            print(f"{Colors.BLUE}[{timestamp}] ℹ️  {message}{Colors.END}")
+            print(f"{c.BLUE}[{timestamp}] ℹ️  {message}{c.END}")
         elif level == "HEADER":
-            print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.END}")
-            print(f"{Colors.BOLD}{Colors.CYAN}{message.center(60)}{Colors.END}")
-            print(f"{Colors.BOLD}{Colors.CYAN}{'='*60}{Colors.END}\n")
+            print(f"\n{c.BOLD}{c.CYAN}{'='*60}{c.END}")
+            print(f"{c.BOLD}{c.CYAN}{message.center(60)}{c.END}")
+            print(f"{c.BOLD}{c.CYAN}{'='*60}{c.END}\n")
         else:
             print(f"[{timestamp}] {message}")
     
+    def _record_result(self, test_name: str, result: dict):
+        """Store a step result and update the running summary counters."""
+        self.results[test_name] = result
+        self.aggregate.record(test_name, result)
+    
+    def _remaining_timeout(self, timeout: float) -> float:
+        """Clamp a per-script timeout to the time left before the shared deadline."""
+        if self.deadline is None:
+            return timeout
+        return min(timeout, max(1, self.deadline - time.monotonic()))
+    
+    def _cache_file(self, script_path: Path, args: list) -> Path:
+        """Return the cache file keyed on script contents, arguments and backend URL."""
+        key = hashlib.blake2b(
+            script_path.read_bytes() + repr(list(args)).encode() + (self.backend_url or "").encode(),
+            digest_size=16
+        ).hexdigest()
+        return CACHE_DIR / f"{key}.json"
+    
+    def _load_cached_result(self, script_path: Path, args: list) -> Optional[dict]:
+        """Return a cached result younger than the cache TTL, if caching is enabled."""
+        if not self.cache_ttl:
+            return None
+        
+        cache_file = self._cache_file(script_path, args)
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            with open(cache_file, 'r') as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        result["cached"] = True
+        return result
+    
+    def _store_cached_result(self, script_path: Path, args: list, result: dict):
+        """Atomically cache a successful result, if caching is enabled."""
+        if not self.cache_ttl or not result["success"]:
+            return
+        
+        cache_file = self._cache_file(script_path, args)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            self.log(f"Could not cache result: {e}", "WARNING")
+    
     def run_script(self, script_name: str, args: list = None, timeout: int = 300) -> dict:
         """Run a diagnostic script and return results."""
         script_path = self.scripts_dir / script_name
@@ -77,16 +242,39 @@ class DiagnosticRunner:
         if args:
             cmd.extend(args)
         
-        self.log(f"Running: {' '.join(cmd)}", "INFO")
+        cached = self._load_cached_result(script_path, args or [])
+        if cached is not None:
+            self.log(f"Using cached result: {' '.join(cmd)}", "INFO")
+            return cached
         
+        prefetched = self._prefetched.pop((script_name, tuple(args or [])), None)
+        if prefetched is not None:
+            self.log(f"Collected parallel run: {' '.join(cmd)}", "INFO")
+            result = prefetched
+        else:
+            self.log(f"Running: {' '.join(cmd)}", "INFO")
+            result = self._execute_script(cmd, self._remaining_timeout(timeout))
+        
+        self._store_cached_result(script_path, args or [], result)
+        return result
+    
+    def _execute_script(self, cmd: list, timeout: float) -> dict:
+        """Run a script command as a subprocess from the project root."""
         try:
+            # Scripts run from the project root. When we are already there,
+            # leaving cwd unset (and fds open - they are non-inheritable by
+            # default) lets subprocess launch via posix_spawn instead of fork+exec.
+            project_root = self.scripts_dir.parent.resolve()
+            cwd = None if Path.cwd().resolve() == project_root else project_root
+            
             start_time = time.time()
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                cwd=self.scripts_dir.parent  # Run from project root
+                cwd=cwd,
+                close_fds=False
             )
             duration = time.time() - start_time
             
@@ -102,7 +290,7 @@ class DiagnosticRunner:
         except subprocess.TimeoutExpired:
             return {
                 "success": False,
-                "error": f"Script timed out after {timeout} seconds",
+                "error": f"Script timed out after {timeout:.0f} seconds",
                 "exit_code": -2,
                 "stdout": "",
                 "stderr": "",
@@ -118,14 +306,151 @@ class DiagnosticRunner:
                 "duration": 0
             }
     
+    def prefetch_scripts(self, scripts: list, timeout: int = 300):
+        """Run several diagnostic scripts concurrently, each in its own forked process.
+        
+        Results are stored and handed back by run_script() when the same
+        script and arguments are requested, so the per-step output keeps
+        its usual order. A fresh process per script keeps module state,
+        sys.argv and the working directory of one script from leaking into
+        another. Does nothing where fork is unavailable (Windows), leaving
+        run_script() to launch each script as a subprocess.
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return
+        
+        for module_name in PRELOAD_MODULES:
+            try:
+                importlib.import_module(module_name)
+            except ImportError:
+                pass
+        
+        cwd = str(self.scripts_dir.parent)
+        timeout = self._remaining_timeout(timeout)
+        context = multiprocessing.get_context("fork")
+        running = {}
+        for script_name, args in scripts:
+            script_path = self.scripts_dir / script_name
+            if script_path.exists() and self._load_cached_result(script_path, args) is None:
+                reader, writer = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_run_script_in_child,
+                    args=(writer, str(script_path), args, cwd),
+                    daemon=True
+                )
+                process.start()
+                writer.close()
+                running[reader] = ((script_name, tuple(args)), process)
+        
+        # Collect results as they arrive; reading before join() keeps a child
+        # with large output from blocking on a full pipe
+        deadline = time.monotonic() + timeout
+        while running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for reader in multiprocessing.connection.wait(list(running), timeout=remaining):
+                key, process = running.pop(reader)
+                try:
+                    self._prefetched[key] = reader.recv()
+                except EOFError:
+                    process.join()
+                    self._prefetched[key] = {
+                        "success": False,
+                        "error": f"Script process exited with code {process.exitcode} without a result",
+                        "exit_code": -3,
+                        "stdout": "",
+                        "stderr": "",
+                        "duration": 0
+                    }
+                reader.close()
+                process.join()
+        
+        # Scripts still running at the deadline are terminated
+        for reader, (key, process) in running.items():
+            process.terminate()
+            process.join()
+            reader.close()
+            self._prefetched[key] = {
+                "success": False,
+                "error": f"Script timed out after {timeout:.0f} seconds",
+                "exit_code": -2,
+                "stdout": "",
+                "stderr": "",
+                "duration": timeout
+            }
+    
+    def _validation_script(self):
+        """Return the path of the project root's validation script, if present.
+        
+        The script is byte-compiled once into the project's .cache directory
+        and the .pyc is run instead, since a script run as __main__ is otherwise
+        re-parsed on every launch. It is recompiled unless the source mtime and
+        size recorded in the .pyc header match the current file exactly. Falls
+        back to the source file if compilation fails.
+        """
+        source = self.scripts_dir.parent / "validate_deployment.py"
+        if not source.exists():
+            return None
+        
+        compiled = self.scripts_dir.parent / ".cache" / "validate_deployment.pyc"
+        try:
+            stat = source.stat()
+            expected = (int(stat.st_mtime) & 0xFFFFFFFF, stat.st_size & 0xFFFFFFFF)
+            try:
+                with open(compiled, 'rb') as f:
+                    header = f.read(16)
+                up_to_date = (
+                    len(header) == 16
+                    and header[:4] == importlib.util.MAGIC_NUMBER
+                    and int.from_bytes(header[4:8], "little") == 0
+                    and (int.from_bytes(header[8:12], "little"),
+                         int.from_bytes(header[12:16], "little")) == expected
+                )
+            except OSError:
+                up_to_date = False
+            if not up_to_date:
+                compiled.parent.mkdir(parents=True, exist_ok=True)
+                py_compile.compile(
+                    str(source), cfile=str(compiled), doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP
+                )
+            return str(compiled)
+        except (OSError, py_compile.PyCompileError):
+            return str(source)
+    
+    def _diagnostics_args(self) -> list:
+        """Build arguments for diagnose_issues.py."""
+        args = []
+        if self.backend_url:
+            args.extend(["--backend-url", self.backend_url])
+        if self.verbose:
+            args.append("--verbose")
+        return args
+    
+    def _network_args(self) -> list:
+        """Build arguments for test_network_connectivity.py."""
+        args = []
+        if self.backend_url:
+            args.extend(["--backend-url", self.backend_url])
+        if self.verbose:
+            args.append("--verbose")
+        return args
+    
+    def _error_reporting_args(self) -> list:
+        """Build arguments for error_reporter.py."""
+        args = ["--generate-report"]
+        if self.verbose:
+            args.append("--debug")
+        return args
+    
     def run_validation_script(self):
         """Run the main validation script."""
         self.log("DEPLOYMENT VALIDATION", "HEADER")
         
         # Check if validation script exists in root directory
-        validation_script = Path("validate_deployment.py")
-        if validation_script.exists():
-            result = self.run_script("../validate_deployment.py")
+        if self.validation_script:
+            result = self.run_script(self.validation_script)
         else:
             result = {
                 "success": False,
@@ -136,14 +461,14 @@ class DiagnosticRunner:
                 "duration": 0
             }
         
-        self.results["validation"] = result
+        self._record_result("validation", result)
         
         if result["success"]:
             self.log(f"Validation completed successfully ({result['duration']:.1f}s)", "SUCCESS")
         else:
             self.log(f"Validation failed: {result.get('error', 'Unknown error')}", "ERROR")
             if result["stderr"]:
-                print(f"{Colors.RED}Error output:{Colors.END}")
+                print(f"{self.colors.RED}Error output:{self.colors.END}")
                 print(result["stderr"])
         
         return result["success"]
@@ -152,21 +477,15 @@ class DiagnosticRunner:
         """Run comprehensive diagnostic checks."""
         self.log("COMPREHENSIVE DIAGNOSTICS", "HEADER")
         
-        args = []
-        if self.backend_url:
-            args.extend(["--backend-url", self.backend_url])
-        if self.verbose:
-            args.append("--verbose")
-        
-        result = self.run_script("diagnose_issues.py", args)
-        self.results["diagnostics"] = result
+        result = self.run_script("diagnose_issues.py", self._diagnostics_args())
+        self._record_result("diagnostics", result)
         
         if result["success"]:
             self.log(f"Diagnostics completed successfully ({result['duration']:.1f}s)", "SUCCESS")
         else:
             self.log(f"Diagnostics failed: {result.get('error', 'Unknown error')}", "ERROR")
             if result["stderr"]:
-                print(f"{Colors.RED}Error output:{Colors.END}")
+                print(f"{self.colors.RED}Error output:{self.colors.END}")
                 print(result["stderr"])
         
         return result["success"]
@@ -175,21 +494,15 @@ class DiagnosticRunner:
         """Run network connectivity tests."""
         self.log("NETWORK CONNECTIVITY TESTS", "HEADER")
         
-        args = []
-        if self.backend_url:
-            args.extend(["--backend-url", self.backend_url])
-        if self.verbose:
-            args.append("--verbose")
-        
-        result = self.run_script("test_network_connectivity.py", args)
-        self.results["network"] = result
+        result = self.run_script("test_network_connectivity.py", self._network_args())
+        self._record_result("network", result)
         
         if result["success"]:
             self.log(f"Network tests completed successfully ({result['duration']:.1f}s)", "SUCCESS")
         else:
             self.log(f"Network tests failed: {result.get('error', 'Unknown error')}", "ERROR")
             if result["stderr"]:
-                print(f"{Colors.RED}Error output:{Colors.END}")
+                print(f"{self.colors.RED}Error output:{self.colors.END}")
                 print(result["stderr"])
         
         return result["success"]
@@ -198,19 +511,15 @@ class DiagnosticRunner:
         """Run error reporting and log collection."""
         self.log("ERROR REPORTING AND LOG COLLECTION", "HEADER")
         
-        args = ["--generate-report"]
-        if self.verbose:
-            args.append("--debug")
-        
-        result = self.run_script("error_reporter.py", args)
-        self.results["error_reporting"] = result
+        result = self.run_script("error_reporter.py", self._error_reporting_args())
+        self._record_result("error_reporting", result)
         
         if result["success"]:
             self.log(f"Error reporting completed successfully ({result['duration']:.1f}s)", "SUCCESS")
         else:
             self.log(f"Error reporting failed: {result.get('error', 'Unknown error')}", "ERROR")
             if result["stderr"]:
-                print(f"{Colors.RED}Error output:{Colors.END}")
+                print(f"{self.colors.RED}Error output:{self.colors.END}")
                 print(result["stderr"])
         
         return result["success"]
@@ -219,81 +528,74 @@ class DiagnosticRunner:
         """Run quick diagnostic checks."""
         self.log("QUICK DIAGNOSTICS", "HEADER")
         
-        success_count = 0
-        total_count = 0
-        
-        # Run validation
-        total_count += 1
-        if self.run_validation_script():
-            success_count += 1
+        if self.parallel:
+            scripts = [("test_network_connectivity.py", self._network_args())]
+            if self.validation_script:
+                scripts.append((self.validation_script, []))
+            self.prefetch_scripts(scripts)
         
-        # Run network tests
-        total_count += 1
-        if self.run_network_tests():
-            success_count += 1
+        self.run_validation_script()
+        self.run_network_tests()
         
-        return success_count, total_count
+        return self.aggregate.success, self.aggregate.total
     
     def run_full_diagnostics(self):
         """Run all diagnostic checks."""
         self.log("FULL DIAGNOSTIC SUITE", "HEADER")
         
-        success_count = 0
-        total_count = 0
-        
-        # Run validation
-        total_count += 1
-        if self.run_validation_script():
-            success_count += 1
-        
-        # Run comprehensive diagnostics
-        total_count += 1
-        if self.run_comprehensive_diagnostics():
-            success_count += 1
-        
-        # Run network tests
-        total_count += 1
-        if self.run_network_tests():
-            success_count += 1
-        
-        # Run error reporting
-        total_count += 1
-        if self.run_error_reporting():
-            success_count += 1
-        
-        return success_count, total_count
+        if self.parallel:
+            scripts = [
+                ("diagnose_issues.py", self._diagnostics_args()),
+                ("test_network_connectivity.py", self._network_args()),
+                ("error_reporter.py", self._error_reporting_args())
+            ]
+            if self.validation_script:
+                scripts.append((self.validation_script, []))
+            self.prefetch_scripts(scripts)
+        
+        self.run_validation_script()
+        self.run_comprehensive_diagnostics()
+        self.run_network_tests()
+        self.run_error_reporting()
+        
+        return self.aggregate.success, self.aggregate.total
     
     def generate_summary(self, success_count: int, total_count: int):
         """Generate and display summary of all diagnostic runs."""
         self.log("DIAGNOSTIC SUMMARY", "HEADER")
         
-        print(f"{Colors.BOLD}Total Tests Run: {total_count}{Colors.END}")
-        print(f"{Colors.GREEN}Successful: {success_count}{Colors.END}")
-        print(f"{Colors.RED}Failed: {total_count - success_count}{Colors.END}")
+        # Build the whole summary and write it in one go
+        c = self.colors
+        out = []
+        append = out.append
+        
+        append(f"{c.BOLD}Total Tests Run: {total_count}{c.END}")
+        append(f"{c.GREEN}Successful: {success_count}{c.END}")
+        append(f"{c.RED}Failed: {total_count - success_count}{c.END}")
         
         success_rate = (success_count / total_count * 100) if total_count > 0 else 0
-        print(f"{Colors.BLUE}Success Rate: {success_rate:.1f}%{Colors.END}")
+        append(f"{c.BLUE}Success Rate: {success_rate:.1f}%{c.END}")
         
         # Show individual results
-        print(f"\n{Colors.BOLD}Individual Results:{Colors.END}")
-        for test_name, result in self.results.items():
-            status = "✅ PASS" if result["success"] else "❌ FAIL"
-            duration = f"({result['duration']:.1f}s)" if result.get("duration") else ""
-            print(f"  {status} {test_name.title()} {duration}")
+        append(f"\n{c.BOLD}Individual Results:{c.END}")
+        for test_name, outcome in self.aggregate.per_test.items():
+            status = "✅ PASS" if outcome.success else "❌ FAIL"
+            duration = f"({outcome.duration:.1f}s)" if outcome.duration else ""
+            append(f"  {status} {test_name.title()} {duration}")
             
-            if not result["success"] and result.get("error"):
-                print(f"    Error: {result['error']}")
+            if not outcome.success and outcome.error:
+                append(f"    Error: {outcome.error}")
         
         # Recommendations
-        print(f"\n{Colors.BOLD}Recommendations:{Colors.END}")
+        append(f"\n{c.BOLD}Recommendations:{c.END}")
         
         if success_count == total_count:
-            print(f"{Colors.GREEN}  ✨ All diagnostics passed! Your system appears to be ready for deployment.{Colors.END}")
+            append(f"{c.GREEN}  ✨ All diagnostics passed! Your system appears to be ready for deployment.{c.END}")
         else:
-            print(f"{Colors.YELLOW}  🔧 Some diagnostics failed. Review the errors above and:{Colors.END}")
-            print(f"{Colors.YELLOW}     1. Check the troubleshooting guide (TROUBLESHOOTING_GUIDE.md){Colors.END}")
-            print(f"{Colors.YELLOW}     2. Review generated error reports{Colors.END}")
-            print(f"{Colors.YELLOW}     3. Fix identified issues and re-run diagnostics{Colors.END}")
+            append(f"{c.YELLOW}  🔧 Some diagnostics failed. Review the errors above and:{c.END}")
+            append(f"{c.YELLOW}     1. Check the troubleshooting guide (TROUBLESHOOTING_GUIDE.md){c.END}")
+            append(f"{c.YELLOW}     2. Review generated error reports{c.END}")
+            append(f"{c.YELLOW}     3. Fix identified issues and re-run diagnostics{c.END}")
         
         # Show generated files
         generated_files = []
@@ -304,9 +606,12 @@ class DiagnosticRunner:
         generated_files.extend(error_reports)
         
         if generated_files:
-            print(f"\n{Colors.BOLD}Generated Files:{Colors.END}")
+            append(f"\n{c.BOLD}Generated Files:{c.END}")
             for file in generated_files:
-                print(f"  📄 {file}")
+                append(f"  📄 {file}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
         
         return success_count == total_count
 
@@ -317,18 +622,29 @@ def main():
     parser.add_argument("--quick", action="store_true", help="Run quick diagnostic tests only")
     parser.add_argument("--backend-url", help="Backend URL to test")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--parallel", action="store_true", help="Run diagnostic scripts concurrently in forked worker processes")
+    parser.add_argument("--total-timeout", type=int, default=int(os.getenv("TOTAL_TIMEOUT", "0")) or None,
+                        help="Overall time budget in seconds shared by all scripts (default: TOTAL_TIMEOUT env var)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse successful results of unchanged scripts from recent runs")
+    parser.add_argument("--cache-ttl", type=int, default=600,
+                        help="Maximum age in seconds of cached results used with --cache (default: 600)")
     
     args = parser.parse_args()
     
-    print(f"{Colors.BOLD}{Colors.BLUE}🚀 RAG AI-Agent Diagnostic Runner{Colors.END}")
-    print(f"{Colors.BOLD}{'='*60}{Colors.END}")
-    print(f"{Colors.BOLD}Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.END}")
-    
     # Create diagnostic runner
     runner = DiagnosticRunner(
         backend_url=args.backend_url,
-        verbose=args.verbose
+        verbose=args.verbose,
+        parallel=args.parallel,
+        total_timeout=args.total_timeout,
+        cache_ttl=args.cache_ttl if args.cache else None
     )
+    c = runner.colors
+    
+    print(f"{c.BOLD}{c.BLUE}🚀 RAG AI-Agent Diagnostic Runner{c.END}")
+    print(f"{c.BOLD}{'='*60}{c.END}")
+    print(f"{c.BOLD}Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{c.END}")
     
     try:
         if args.quick:
@@ -344,12 +660,11 @@ def main():
         sys.exit(0 if all_passed else 1)
     
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Diagnostics interrupted by user{Colors.END}")
+        print(f"\n{c.YELLOW}Diagnostics interrupted by user{c.END}")
         sys.exit(1)
     except Exception as e:
-        print(f"\n{Colors.RED}Diagnostics failed with error: {str(e)}{Colors.END}")
+        print(f"\n{c.RED}Diagnostics failed with error: {str(e)}{c.END}")
         if args.verbose:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
 
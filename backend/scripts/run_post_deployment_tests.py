@@ -14,15 +14,69 @@ import os
 import sys
 import json
 import time
+import asyncio
 import argparse
 import subprocess
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+
+def _parse_json_bytes(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+async def _read_bytes_async(path: Path) -> Optional[bytes]:
+    """Read a file without blocking the event loop, returning None if it does not exist"""
+    try:
+        if aiofiles is not None:
+            async with aiofiles.open(path, 'rb') as f:
+                return await f.read()
+        return await asyncio.to_thread(path.read_bytes)
+    except FileNotFoundError:
+        return None
+
+
+def _write_json_file(path: Path, data: Dict[str, Any]):
+    """
+    Write a JSON report with 2-space indentation, one top-level key at a time
+    
+    Only a single top-level value is serialized in memory at once, so the large
+    child result sections are never encoded together with the rest of the report.
+    """
+    if orjson is None:
+        # json.dump already streams the encoder's chunks into the file
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+        return
+    
+    with open(path, 'wb') as f:
+        f.write(b"{")
+        for index, (key, value) in enumerate(data.items()):
+            f.write(b",\n  " if index else b"\n  ")
+            f.write(orjson.dumps(key))
+            f.write(b": ")
+            # Raw newlines only occur between tokens, so re-indenting is safe
+            f.write(orjson.dumps(value, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+        f.write(b"\n}" if data else b"}")
 
 class PostDeploymentTestRunner:
     """Orchestrates all post-deployment tests"""
     
-    def __init__(self, base_url: str, timeout: int = 60, output_dir: Optional[str] = None):
+    def __init__(self, base_url: str, timeout: int = 60, output_dir: Optional[str] = None,
+                 concurrent: bool = False):
         """
         Initialize the test runner
         
@@ -30,38 +84,56 @@ class PostDeploymentTestRunner:
             base_url: The base URL of the deployed application
             timeout: Request timeout in seconds
             output_dir: Directory to save test reports
+            concurrent: Run the core and E2E suites at the same time
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.output_dir = output_dir or "test_reports"
+        self.concurrent = concurrent
         self.scripts_dir = Path(__file__).parent
         
+        # Resolve script and result paths once
+        self._core_script = self.scripts_dir / "test_core_functionality.py"
+        self._e2e_script = self.scripts_dir / "test_e2e_workflows.py"
+        self._core_output = Path(self.output_dir) / "core_functionality_results.json"
+        self._e2e_output = Path(self.output_dir) / "e2e_workflow_results.json"
+        
         # Ensure output directory exists
         Path(self.output_dir).mkdir(exist_ok=True)
+    
+    def _core_command(self) -> List[str]:
+        """Build the command line for the core functionality tests"""
+        return [
+            sys.executable, str(self._core_script),
+            "--url", self.base_url,
+            "--timeout", str(self.timeout),
+            "--output", str(self._core_output)
+        ]
+    
+    def _e2e_command(self) -> List[str]:
+        """Build the command line for the E2E workflow tests"""
+        return [
+            sys.executable, str(self._e2e_script),
+            "--url", self.base_url,
+            "--timeout", str(self.timeout),
+            "--output", str(self._e2e_output),
+            "--concurrent-users", "3"
+        ]
         
     def run_core_functionality_tests(self) -> Dict[str, Any]:
         """Run core functionality tests"""
         print("🔧 Running Core Functionality Tests...")
         print("-" * 50)
         
-        script_path = self.scripts_dir / "test_core_functionality.py"
-        output_file = Path(self.output_dir) / "core_functionality_results.json"
-        
         try:
-            cmd = [
-                sys.executable, str(script_path),
-                "--url", self.base_url,
-                "--timeout", str(self.timeout),
-                "--output", str(output_file)
-            ]
+            cmd = self._core_command()
             
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
             
             # Load results from output file
-            if output_file.exists():
-                with open(output_file, 'r') as f:
-                    results = json.load(f)
-            else:
+            try:
+                results = _parse_json_bytes(self._core_output.read_bytes())
+            except FileNotFoundError:
                 results = {"error": "No output file generated"}
             
             results["exit_code"] = result.returncode
@@ -87,25 +159,15 @@ class PostDeploymentTestRunner:
         print("\n🌐 Running End-to-End Workflow Tests...")
         print("-" * 50)
         
-        script_path = self.scripts_dir / "test_e2e_workflows.py"
-        output_file = Path(self.output_dir) / "e2e_workflow_results.json"
-        
         try:
-            cmd = [
-                sys.executable, str(script_path),
-                "--url", self.base_url,
-                "--timeout", str(self.timeout),
-                "--output", str(output_file),
-                "--concurrent-users", "3"
-            ]
+            cmd = self._e2e_command()
             
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
             
             # Load results from output file
-            if output_file.exists():
-                with open(output_file, 'r') as f:
-                    results = json.load(f)
-            else:
+            try:
+                results = _parse_json_bytes(self._e2e_output.read_bytes())
+            except FileNotFoundError:
                 results = {"error": "No output file generated"}
             
             results["exit_code"] = result.returncode
@@ -126,6 +188,62 @@ class PostDeploymentTestRunner:
                 "exit_code": -1
             }
     
+    async def _run_suite_async(self, cmd: List[str], timeout: int) -> Tuple[int, str, str]:
+        """Run a test suite subprocess, killing it if it exceeds the timeout"""
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    
+    def _collect_suite_results(self, run: Any, data: Optional[bytes],
+                               timeout_message: str, failure_message: str) -> Dict[str, Any]:
+        """Combine a suite's process outcome with its parsed result file"""
+        if isinstance(run, asyncio.TimeoutError):
+            return {"error": timeout_message, "exit_code": -1, "timeout": True}
+        if isinstance(run, Exception):
+            return {"error": f"{failure_message}: {str(run)}", "exit_code": -1}
+        
+        try:
+            results = _parse_json_bytes(data) if data is not None else {"error": "No output file generated"}
+        except Exception as e:
+            return {"error": f"{failure_message}: {str(e)}", "exit_code": -1}
+        
+        results["exit_code"], results["stdout"], results["stderr"] = run
+        return results
+    
+    async def run_tests_concurrently(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run the core functionality and E2E workflow suites at the same time"""
+        print("🔧🌐 Running Core Functionality and End-to-End Workflow Tests concurrently...")
+        print("-" * 50)
+        
+        core_run, e2e_run = await asyncio.gather(
+            self._run_suite_async(self._core_command(), 300),
+            self._run_suite_async(self._e2e_command(), 600),
+            return_exceptions=True
+        )
+        core_bytes, e2e_bytes = await asyncio.gather(
+            _read_bytes_async(self._core_output),
+            _read_bytes_async(self._e2e_output)
+        )
+        
+        core_results = self._collect_suite_results(
+            core_run, core_bytes,
+            "Core functionality tests timed out",
+            "Failed to run core functionality tests"
+        )
+        e2e_results = self._collect_suite_results(
+            e2e_run, e2e_bytes,
+            "E2E workflow tests timed out",
+            "Failed to run E2E workflow tests"
+        )
+        return core_results, e2e_results
+    
     def check_prerequisites(self) -> Dict[str, bool]:
         """Check if all prerequisites are met"""
         print("🔍 Checking Prerequisites...")
@@ -133,7 +251,7 @@ class PostDeploymentTestRunner:
         checks = {}
         
         # Check if required Python packages are installed
-        required_packages = ['requests', 'aiohttp']
+        required_packages = ['requests', 'aiohttp', 'httpx']
         for package in required_packages:
             try:
                 __import__(package)
@@ -142,11 +260,8 @@ class PostDeploymentTestRunner:
                 checks[f"package_{package}"] = False
         
         # Check if test scripts exist
-        core_script = self.scripts_dir / "test_core_functionality.py"
-        e2e_script = self.scripts_dir / "test_e2e_workflows.py"
-        
-        checks["core_script_exists"] = core_script.exists()
-        checks["e2e_script_exists"] = e2e_script.exists()
+        checks["core_script_exists"] = self._core_script.exists()
+        checks["e2e_script_exists"] = self._e2e_script.exists()
         
         # Check if application is accessible
         try:
@@ -169,11 +284,14 @@ class PostDeploymentTestRunner:
         """Generate a consolidated test report"""
         
         # Extract key metrics
-        core_success = core_results.get("summary", {}).get("success_rate", 0) if "summary" in core_results else 0
-        e2e_success = e2e_results.get("summary", {}).get("success_rate", 0) if "summary" in e2e_results else 0
+        core_summary = core_results.get("summary", {})
+        e2e_summary = e2e_results.get("summary", {})
         
-        core_tests = core_results.get("summary", {}).get("total_tests", 0) if "summary" in core_results else 0
-        e2e_workflows = e2e_results.get("summary", {}).get("total_workflows", 0) if "summary" in e2e_results else 0
+        core_success = core_summary.get("success_rate", 0)
+        e2e_success = e2e_summary.get("success_rate", 0)
+        
+        core_tests = core_summary.get("total_tests", 0)
+        e2e_workflows = e2e_summary.get("total_workflows", 0)
         
         # Calculate overall success
         all_prereqs_passed = all(prerequisites.values())
@@ -261,11 +379,15 @@ class PostDeploymentTestRunner:
             print("\n❌ Prerequisites not met. Please resolve issues before running tests.")
             return self.generate_consolidated_report({}, {}, prerequisites)
         
-        # Step 2: Run core functionality tests
-        core_results = self.run_core_functionality_tests()
-        
-        # Step 3: Run E2E workflow tests
-        e2e_results = self.run_e2e_workflow_tests()
+        if self.concurrent:
+            # Steps 2-3: Run both suites at the same time
+            core_results, e2e_results = asyncio.run(self.run_tests_concurrently())
+        else:
+            # Step 2: Run core functionality tests
+            core_results = self.run_core_functionality_tests()
+            
+            # Step 3: Run E2E workflow tests
+            e2e_results = self.run_e2e_workflow_tests()
         
         # Step 4: Generate consolidated report
         report = self.generate_consolidated_report(core_results, e2e_results, prerequisites)
@@ -273,8 +395,7 @@ class PostDeploymentTestRunner:
         
         # Step 5: Save consolidated report
         report_file = Path(self.output_dir) / "consolidated_test_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        _write_json_file(report_file, report)
         
         # Step 6: Print final summary
         self.print_final_summary(report)
@@ -283,32 +404,39 @@ class PostDeploymentTestRunner:
     
     def print_final_summary(self, report: Dict[str, Any]):
         """Print final test summary"""
-        print("\n" + "=" * 60)
-        print("📋 FINAL TEST SUMMARY")
-        print("=" * 60)
+        # Build the whole summary and write it in one go
+        out = []
+        append = out.append
+        
+        append("\n" + "=" * 60)
+        append("📋 FINAL TEST SUMMARY")
+        append("=" * 60)
         
         summary = report["summary"]
         
-        print(f"Overall Success: {'✅ PASS' if report['overall_success'] else '❌ FAIL'}")
-        print(f"Total Duration: {report.get('total_duration', 0):.2f}s")
-        print()
+        append(f"Overall Success: {'✅ PASS' if report['overall_success'] else '❌ FAIL'}")
+        append(f"Total Duration: {report.get('total_duration', 0):.2f}s")
+        append("")
         
-        print("Component Results:")
-        print(f"  Prerequisites: {'✅ PASS' if summary['prerequisites_passed'] else '❌ FAIL'}")
-        print(f"  Core Functionality: {'✅ PASS' if summary['core_functionality_passed'] else '❌ FAIL'} ({summary['core_success_rate']:.1f}%)")
-        print(f"  E2E Workflows: {'✅ PASS' if summary['e2e_workflows_passed'] else '❌ FAIL'} ({summary['e2e_success_rate']:.1f}%)")
-        print()
+        append("Component Results:")
+        append(f"  Prerequisites: {'✅ PASS' if summary['prerequisites_passed'] else '❌ FAIL'}")
+        append(f"  Core Functionality: {'✅ PASS' if summary['core_functionality_passed'] else '❌ FAIL'} ({summary['core_success_rate']:.1f}%)")
+        append(f"  E2E Workflows: {'✅ PASS' if summary['e2e_workflows_passed'] else '❌ FAIL'} ({summary['e2e_success_rate']:.1f}%)")
+        append("")
         
-        print("Test Coverage:")
-        print(f"  Core Tests: {summary['total_core_tests']}")
-        print(f"  E2E Workflows: {summary['total_e2e_workflows']}")
-        print()
+        append("Test Coverage:")
+        append(f"  Core Tests: {summary['total_core_tests']}")
+        append(f"  E2E Workflows: {summary['total_e2e_workflows']}")
+        append("")
         
-        print("Recommendations:")
+        append("Recommendations:")
         for rec in report["recommendations"]:
-            print(f"  {rec}")
+            append(f"  {rec}")
+        
+        append(f"\n📄 Detailed reports saved in: {self.output_dir}/")
         
-        print(f"\n📄 Detailed reports saved in: {self.output_dir}/")
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
 def main():
     """Main function"""
@@ -317,11 +445,12 @@ def main():
     parser.add_argument("--timeout", type=int, default=60, help="Request timeout in seconds")
     parser.add_argument("--output-dir", default="test_reports", help="Directory to save test reports")
     parser.add_argument("--quiet", action="store_true", help="Suppress verbose output")
+    parser.add_argument("--concurrent", action="store_true", help="Run core and E2E test suites concurrently")
     
     args = parser.parse_args()
     
     # Initialize test runner
-    runner = PostDeploymentTestRunner(args.url, args.timeout, args.output_dir)
+    runner = PostDeploymentTestRunner(args.url, args.timeout, args.output_dir, args.concurrent)
     
     try:
         # Run all tests
@@ -10,17 +10,67 @@ This script tests the core functionality of the deployed RAG AI Agent applicatio
 Requirements: 7.1, 7.2, 7.3, 7.4
 """
 
-import os
+import io
+import re
 import sys
 import json
 import time
-import requests
-import tempfile
+import asyncio
+import httpx
+import importlib.util
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Compressed agent responses; br is only advertised when httpx can decode it (httpx[brotli])
+ACCEPT_ENCODING = "gzip, br" if (importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")) else "gzip"
+
+# ETag / Last-Modified of the /docs page per base URL, for conditional health checks
+HEALTHCHECK_CACHE = Path.home() / ".cache" / "ragtests" / "healthcheck.json"
+
+# Bytes of a failed response body kept in the result details
+ERROR_BODY_BYTES = 512
+
+# Any of these in the document query answer shows the uploaded content was used
+DOC_QUERY_KEYWORDS_RE = re.compile(r'artificial intelligence|machine learning|computer science', re.IGNORECASE)
+
+# Chats created up front: simple message + retrieval, agent message + rename,
+# and document upload + query each get their own
+FIXTURE_CHATS = 3
+
+# Document uploaded by the upload test
+TEST_DOC_BYTES = b"""
+        Test Document for RAG AI Agent
+        
+        This is a test document containing sample information about artificial intelligence.
+        
+        Artificial Intelligence (AI) is a branch of computer science that aims to create 
+        intelligent machines that can perform tasks that typically require human intelligence.
+        
+        Key concepts in AI include:
+        - Machine Learning
+        - Natural Language Processing
+        - Computer Vision
+        - Robotics
+        
+        This document is used for testing the document upload and processing functionality
+        of the RAG AI Agent application.
+        """
+
+@dataclass(slots=True, frozen=True)
 class TestResult:
     """Represents the result of a test case"""
     test_name: str
@@ -32,36 +82,115 @@ class TestResult:
 class CoreFunctionalityTester:
     """Tests core functionality of the RAG AI Agent application"""
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30, bulk_fixtures: bool = False):
         """
         Initialize the tester with the base URL of the deployed application
         
         Args:
             base_url: The base URL of the deployed application (e.g., https://your-app.hf.space)
             timeout: Request timeout in seconds
+            bulk_fixtures: Create/rename/delete the test chat through the bulk
+                test-fixtures endpoint when the server enables it
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
+        self.bulk_fixtures = bulk_fixtures
+        self._bulk_supported: Optional[bool] = None
+        # One pooled client for all tests; connection setup is retried, requests are not.
+        # Over HTTP/2 (negotiated via ALPN on HTTPS) concurrent tests share one connection.
+        # Pool and protocol settings must live on the transport: httpx ignores
+        # the client-level ones when a transport is passed in.
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers={"Accept-Encoding": ACCEPT_ENCODING},
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                retries=2
+            )
+        )
         self.test_results: List[TestResult] = []
+        # Result lines are collected here and written to stdout in one go
+        self._stdout_buf: List[str] = []
         
+    def _json(self, response: httpx.Response):
+        """Decode a JSON response body, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _error_body(self, response: httpx.Response) -> str:
+        """First bytes of a failed response body, for the result details"""
+        return response.content[:ERROR_BODY_BYTES].decode('utf-8', errors='replace')
+    
     def log_result(self, test_name: str, passed: bool, message: str, details: Optional[Dict] = None, duration: float = 0.0):
         """Log a test result"""
         result = TestResult(test_name, passed, message, details, duration)
         self.test_results.append(result)
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} {test_name}: {message}")
+        self._stdout_buf.append(f"{status} {test_name}: {message}\n")
         if details and not passed:
-            print(f"   Details: {details}")
+            self._stdout_buf.append(f"   Details: {details}\n")
+    
+    def flush_output(self):
+        """Write buffered result lines to stdout"""
+        if self._stdout_buf:
+            sys.stdout.write(''.join(self._stdout_buf))
+            sys.stdout.flush()
+            self._stdout_buf.clear()
     
-    def test_health_check(self) -> bool:
+    def _load_health_validators(self) -> Dict[str, str]:
+        """Build conditional request headers from the cached /docs validators"""
+        try:
+            with open(HEALTHCHECK_CACHE, 'r') as f:
+                entry = json.load(f).get(self.base_url, {})
+        except (OSError, ValueError):
+            return {}
+        
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def _save_health_validators(self, response: httpx.Response):
+        """Remember the /docs validators so the next run can get a 304"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        
+        try:
+            with open(HEALTHCHECK_CACHE, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        
+        cache[self.base_url] = {"etag": etag, "last_modified": last_modified}
+        try:
+            HEALTHCHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            with open(HEALTHCHECK_CACHE, 'w') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    
+    async def test_health_check(self) -> bool:
         """Test if the application is accessible"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = self.session.get(f"{self.base_url}/docs", timeout=self.timeout)
-            duration = time.time() - start_time
+            # Only the status matters, so avoid downloading the Swagger page
+            headers = self._load_health_validators()
+            response = await self.client.head("/docs", headers=headers, follow_redirects=True)
+            if response.status_code == 405:
+                async with self.client.stream("GET", "/docs", headers=headers, follow_redirects=True) as response:
+                    pass
+            duration = time.perf_counter() - start_time
             
-            if response.status_code == 200:
+            if response.status_code in (200, 304):
+                if response.status_code == 200:
+                    self._save_health_validators(response)
                 self.log_result("Health Check", True, "Application is accessible", duration=duration)
                 return True
             else:
@@ -69,21 +198,21 @@ class CoreFunctionalityTester:
                               {"status_code": response.status_code}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Health Check", False, f"Connection failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def test_chat_creation(self) -> Optional[int]:
+    async def test_chat_creation(self) -> Optional[int]:
         """Test creating a new chat"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = self.session.post(f"{self.base_url}/api/chats/new/", timeout=self.timeout)
-            duration = time.time() - start_time
+            response = await self.client.post("/api/chats/new/")
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 chat_id = data.get('chat_id')
                 if chat_id:
                     self.log_result("Chat Creation", True, f"Chat created with ID: {chat_id}", 
@@ -95,24 +224,116 @@ class CoreFunctionalityTester:
                     return None
             else:
                 self.log_result("Chat Creation", False, f"Failed with status: {response.status_code}", 
-                              {"status_code": response.status_code, "response": response.text}, duration)
+                              {"status_code": response.status_code, "response": self._error_body(response)}, duration)
                 return None
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Chat Creation", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return None
     
-    def test_chat_listing(self) -> bool:
+    async def bulk_chat_operations(self, create: Optional[List[str]] = None,
+                                   rename: Optional[List[Dict]] = None,
+                                   delete: Optional[List[int]] = None) -> Optional[Dict]:
+        """
+        Run chat fixture operations in a single request to the bulk endpoint
+        
+        Returns the per-operation status lists, or None when the endpoint is
+        unavailable (in which case the individual endpoint tests are used).
+        """
+        if not self.bulk_fixtures or self._bulk_supported is False:
+            return None
+        
+        try:
+            response = await self.client.post(
+                "/api/chats/_bulk/",
+                json={"create": create or [], "rename": rename or [], "delete": delete or []}
+            )
+        except httpx.HTTPError:
+            self._bulk_supported = False
+            return None
+        
+        self._bulk_supported = response.status_code == 200
+        return self._json(response) if self._bulk_supported else None
+    
+    async def _create_chat_fixtures(self, count: int) -> List[Optional[int]]:
+        """Create the test chats, in a single bulk request when supported"""
+        start_time = time.perf_counter()
+        result = await self.bulk_chat_operations(create=["New Chat"] * count)
+        if result is None:
+            return list(await asyncio.gather(*[self.test_chat_creation() for _ in range(count)]))
+        duration = time.perf_counter() - start_time
+        
+        chat_ids = []
+        for op in result["create"]:
+            if op["status"] == 200 and op.get("chat_id"):
+                self.log_result("Chat Creation", True, f"Chat created with ID: {op['chat_id']} (bulk)", 
+                              {"chat_id": op["chat_id"]}, duration)
+                chat_ids.append(op["chat_id"])
+            else:
+                self.log_result("Chat Creation", False, f"Bulk create failed with status: {op['status']}", 
+                              {"operation": op}, duration)
+                chat_ids.append(None)
+        return chat_ids
+    
+    async def _rename_and_delete_chat_fixtures(self, rename_chat_id: Optional[int], chat_ids: List[int]):
+        """Rename one test chat (unless rename_chat_id is None) and delete all of them in a single bulk request"""
+        start_time = time.perf_counter()
+        new_name = f"Test Chat {int(time.time())}"
+        result = await self.bulk_chat_operations(
+            rename=[{"chat_id": rename_chat_id, "name": new_name}] if rename_chat_id is not None else None,
+            delete=chat_ids
+        )
+        if result is None:
+            if rename_chat_id is not None:
+                await self.test_chat_rename(rename_chat_id)
+            await asyncio.gather(*[self.test_chat_deletion(chat_id) for chat_id in chat_ids])
+            return
+        duration = time.perf_counter() - start_time
+        
+        if rename_chat_id is not None:
+            rename_op = result["rename"][0]
+            if rename_op["status"] == 200:
+                self.log_result("Chat Rename", True, f"Chat renamed to: {new_name} (bulk)", 
+                              {"new_name": new_name}, duration)
+            else:
+                self.log_result("Chat Rename", False, f"Bulk rename failed with status: {rename_op['status']}", 
+                              {"operation": rename_op}, duration)
+        
+        for delete_op in result["delete"]:
+            chat_id = delete_op["chat_id"]
+            if delete_op["status"] == 200:
+                self.log_result("Chat Deletion", True, f"Chat {chat_id} deleted successfully (bulk)", 
+                              {"chat_id": chat_id}, duration)
+            else:
+                self.log_result("Chat Deletion", False, f"Bulk delete failed with status: {delete_op['status']}", 
+                              {"operation": delete_op}, duration)
+    
+    async def _delete_chat_fixtures(self, chat_ids: List[int], rename_chat_id: Optional[int] = None):
+        """Delete the test chats; with bulk fixtures the deferred rename goes in the same request"""
+        if self._bulk_supported:
+            await self._rename_and_delete_chat_fixtures(rename_chat_id, chat_ids)
+        else:
+            await asyncio.gather(*[self.test_chat_deletion(chat_id) for chat_id in chat_ids])
+    
+    async def test_chat_listing(self) -> bool:
         """Test listing all chats"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = self.session.get(f"{self.base_url}/api/chats/", timeout=self.timeout)
-            duration = time.time() - start_time
+            # The chat count comes from X-Total-Count, so only one chat is fetched
+            response = await self.client.get("/api/chats/", params={"limit": 1})
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                chats = response.json()
+                total_count = response.headers.get("X-Total-Count")
+                if total_count is not None and total_count.isdigit():
+                    self.log_result("Chat Listing", True, f"Retrieved {total_count} chats", 
+                                  {"chat_count": int(total_count)}, duration)
+                    return True
+                
+                # Older servers ignore the limit and send the full list
+                chats = self._json(response)
                 if isinstance(chats, list):
                     self.log_result("Chat Listing", True, f"Retrieved {len(chats)} chats", 
                                   {"chat_count": len(chats)}, duration)
@@ -126,24 +347,23 @@ class CoreFunctionalityTester:
                               {"status_code": response.status_code}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Chat Listing", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def test_chat_rename(self, chat_id: int) -> bool:
+    async def test_chat_rename(self, chat_id: int) -> bool:
         """Test renaming a chat"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         new_name = f"Test Chat {int(time.time())}"
         
         try:
-            response = self.session.put(
-                f"{self.base_url}/api/chats/{chat_id}/rename/",
-                json={"name": new_name},
-                timeout=self.timeout
+            response = await self.client.put(
+                f"/api/chats/{chat_id}/rename/",
+                json={"name": new_name}
             )
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
                 self.log_result("Chat Rename", True, f"Chat renamed to: {new_name}", 
@@ -151,35 +371,34 @@ class CoreFunctionalityTester:
                 return True
             else:
                 self.log_result("Chat Rename", False, f"Failed with status: {response.status_code}", 
-                              {"status_code": response.status_code, "response": response.text}, duration)
+                              {"status_code": response.status_code, "response": self._error_body(response)}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Chat Rename", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def test_simple_chat_message(self, chat_id: int) -> bool:
+    async def test_simple_chat_message(self, chat_id: int) -> bool:
         """Test sending a simple chat message (non-agent mode)"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         test_query = "What is artificial intelligence?"
         
         try:
             data = {
                 'query': test_query,
-                'agent': False
+                'agent': 'false'
             }
             
-            response = self.session.post(
-                f"{self.base_url}/api/chats/{chat_id}/send/",
-                data=data,
-                timeout=self.timeout
+            response = await self.client.post(
+                f"/api/chats/{chat_id}/send/",
+                data=data
             )
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                result = response.json()
+                result = self._json(response)
                 agent_response = result.get('agent_response', {})
                 response_body = agent_response.get('body', '')
                 
@@ -193,41 +412,39 @@ class CoreFunctionalityTester:
                     return False
             else:
                 self.log_result("Simple Chat Message", False, f"Failed with status: {response.status_code}", 
-                              {"status_code": response.status_code, "response": response.text}, duration)
+                              {"status_code": response.status_code, "response": self._error_body(response)}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Simple Chat Message", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def test_agent_chat_message(self, chat_id: int) -> bool:
+    async def test_agent_chat_message(self, chat_id: int) -> bool:
         """Test sending a chat message in agent mode"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         test_query = "What is the current time?"
         
         try:
             data = {
                 'query': test_query,
-                'agent': True
+                'agent': 'true'
             }
             
-            response = self.session.post(
-                f"{self.base_url}/api/chats/{chat_id}/send/",
-                data=data,
-                timeout=self.timeout
+            response = await self.client.post(
+                f"/api/chats/{chat_id}/send/",
+                data=data
             )
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                result = response.json()
+                result = self._json(response)
                 agent_response = result.get('agent_response', {})
                 response_body = agent_response.get('body', '')
-                reasoning_steps = agent_response.get('reasoning_steps', [])
                 
                 if response_body and len(response_body) > 10:
-                    has_reasoning = len(reasoning_steps) > 0 if reasoning_steps else False
+                    has_reasoning = bool(agent_response.get('reasoning_steps'))
                     self.log_result("Agent Chat Message", True, 
                                   f"Received agent response with reasoning: {has_reasoning}", 
                                   {"response_length": len(response_body), "has_reasoning": has_reasoning}, duration)
@@ -238,69 +455,36 @@ class CoreFunctionalityTester:
                     return False
             else:
                 self.log_result("Agent Chat Message", False, f"Failed with status: {response.status_code}", 
-                              {"status_code": response.status_code, "response": response.text}, duration)
+                              {"status_code": response.status_code, "response": self._error_body(response)}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Agent Chat Message", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def create_test_file(self) -> str:
-        """Create a temporary test file for upload testing"""
-        content = """
-        Test Document for RAG AI Agent
-        
-        This is a test document containing sample information about artificial intelligence.
-        
-        Artificial Intelligence (AI) is a branch of computer science that aims to create 
-        intelligent machines that can perform tasks that typically require human intelligence.
-        
-        Key concepts in AI include:
-        - Machine Learning
-        - Natural Language Processing
-        - Computer Vision
-        - Robotics
-        
-        This document is used for testing the document upload and processing functionality
-        of the RAG AI Agent application.
-        """
-        
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-        temp_file.write(content)
-        temp_file.close()
-        
-        return temp_file.name
-    
-    def test_document_upload(self, chat_id: int) -> bool:
+    async def test_document_upload(self, chat_id: int) -> bool:
         """Test document upload and processing"""
-        start_time = time.time()
-        test_file_path = None
+        start_time = time.perf_counter()
         
         try:
-            # Create test file
-            test_file_path = self.create_test_file()
+            files = {'files': ('test_document.txt', io.BytesIO(TEST_DOC_BYTES), 'text/plain')}
+            data = {
+                'query': 'I uploaded a test document',
+                'agent': 'false'
+            }
             
-            with open(test_file_path, 'rb') as f:
-                files = {'files': ('test_document.txt', f, 'text/plain')}
-                data = {
-                    'query': 'I uploaded a test document',
-                    'agent': False
-                }
-                
-                response = self.session.post(
-                    f"{self.base_url}/api/chats/{chat_id}/send/",
-                    data=data,
-                    files=files,
-                    timeout=self.timeout
-                )
+            response = await self.client.post(
+                f"/api/chats/{chat_id}/send/",
+                data=data,
+                files=files
+            )
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                result = response.json()
+                result = self._json(response)
                 agent_response = result.get('agent_response', {})
                 response_body = agent_response.get('body', '')
                 
@@ -314,45 +498,39 @@ class CoreFunctionalityTester:
                     return False
             else:
                 self.log_result("Document Upload", False, f"Failed with status: {response.status_code}", 
-                              {"status_code": response.status_code, "response": response.text}, duration)
+                              {"status_code": response.status_code, "response": self._error_body(response)}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Document Upload", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
-        finally:
-            # Clean up test file
-            if test_file_path and os.path.exists(test_file_path):
-                os.unlink(test_file_path)
     
-    def test_document_query(self, chat_id: int) -> bool:
+    async def test_document_query(self, chat_id: int) -> bool:
         """Test querying uploaded document content"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         test_query = "What is mentioned about artificial intelligence in the uploaded document?"
         
         try:
             data = {
                 'query': test_query,
-                'agent': False
+                'agent': 'false'
             }
             
-            response = self.session.post(
-                f"{self.base_url}/api/chats/{chat_id}/send/",
-                data=data,
-                timeout=self.timeout
+            response = await self.client.post(
+                f"/api/chats/{chat_id}/send/",
+                data=data
             )
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                result = response.json()
+                result = self._json(response)
                 agent_response = result.get('agent_response', {})
                 response_body = agent_response.get('body', '')
                 
                 # Check if response contains relevant information from the uploaded document
-                relevant_keywords = ['artificial intelligence', 'machine learning', 'computer science']
-                has_relevant_content = any(keyword.lower() in response_body.lower() for keyword in relevant_keywords)
+                has_relevant_content = DOC_QUERY_KEYWORDS_RE.search(response_body) is not None
                 
                 if has_relevant_content:
                     self.log_result("Document Query", True, "Successfully retrieved information from uploaded document", 
@@ -367,21 +545,21 @@ class CoreFunctionalityTester:
                               {"status_code": response.status_code}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Document Query", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def test_chat_messages_retrieval(self, chat_id: int) -> bool:
+    async def test_chat_messages_retrieval(self, chat_id: int) -> bool:
         """Test retrieving chat messages"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = self.session.get(f"{self.base_url}/api/chats/{chat_id}/messages/", timeout=self.timeout)
-            duration = time.time() - start_time
+            response = await self.client.get(f"/api/chats/{chat_id}/messages/")
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
-                messages = response.json()
+                messages = self._json(response)
                 if isinstance(messages, list) and len(messages) > 0:
                     self.log_result("Chat Messages Retrieval", True, f"Retrieved {len(messages)} messages", 
                                   {"message_count": len(messages)}, duration)
@@ -395,18 +573,18 @@ class CoreFunctionalityTester:
                               {"status_code": response.status_code}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Chat Messages Retrieval", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def test_chat_deletion(self, chat_id: int) -> bool:
+    async def test_chat_deletion(self, chat_id: int) -> bool:
         """Test deleting a chat"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
-            response = self.session.delete(f"{self.base_url}/api/chats/{chat_id}/delete", timeout=self.timeout)
-            duration = time.time() - start_time
+            response = await self.client.delete(f"/api/chats/{chat_id}/delete")
+            duration = time.perf_counter() - start_time
             
             if response.status_code == 200:
                 self.log_result("Chat Deletion", True, f"Chat {chat_id} deleted successfully", 
@@ -414,65 +592,96 @@ class CoreFunctionalityTester:
                 return True
             else:
                 self.log_result("Chat Deletion", False, f"Failed with status: {response.status_code}", 
-                              {"status_code": response.status_code, "response": response.text}, duration)
+                              {"status_code": response.status_code, "response": self._error_body(response)}, duration)
                 return False
                 
-        except requests.exceptions.RequestException as e:
-            duration = time.time() - start_time
+        except (httpx.HTTPError, ValueError) as e:
+            duration = time.perf_counter() - start_time
             self.log_result("Chat Deletion", False, f"Request failed: {str(e)}", 
                           {"error": str(e)}, duration)
             return False
     
-    def run_all_tests(self) -> Dict[str, any]:
+    async def run_all_tests(self) -> Dict[str, any]:
         """Run all core functionality tests"""
         print("🚀 Starting Core Functionality Tests")
         print(f"Testing application at: {self.base_url}")
         print("-" * 60)
         
         # Test 1: Health check
-        if not self.test_health_check():
-            print("❌ Application is not accessible. Stopping tests.")
+        if not await self.test_health_check():
+            self._stdout_buf.append("❌ Application is not accessible. Stopping tests.\n")
             return self.generate_report()
         
-        # Test 2: Chat listing (initial state)
-        self.test_chat_listing()
-        
-        # Test 3: Create a new chat
-        chat_id = self.test_chat_creation()
-        if not chat_id:
-            print("❌ Cannot create chat. Stopping tests.")
+        # Tests 2-3: Chat listing (initial state) and one chat per scenario
+        # group, so the scenarios below never contend on the same chat
+        _, chat_ids = await asyncio.gather(
+            self.test_chat_listing(),
+            self._create_chat_fixtures(FIXTURE_CHATS)
+        )
+        if not all(chat_ids):
+            self._stdout_buf.append("❌ Cannot create chat. Stopping tests.\n")
+            # Don't leave the chats that were created behind on the server
+            created_chat_ids = [chat_id for chat_id in chat_ids if chat_id is not None]
+            if created_chat_ids:
+                await self._delete_chat_fixtures(created_chat_ids)
             return self.generate_report()
+        simple_chat_id, agent_chat_id, document_chat_id = chat_ids
         
-        # Test 4: Rename the chat
-        self.test_chat_rename(chat_id)
-        
-        # Test 5: Send simple chat message
-        self.test_simple_chat_message(chat_id)
-        
-        # Test 6: Send agent chat message
-        self.test_agent_chat_message(chat_id)
-        
-        # Test 7: Upload and process document
-        self.test_document_upload(chat_id)
+        # With bulk fixtures, rename is deferred and sent together with the deletes
+        bulk = bool(self._bulk_supported)
         
-        # Test 8: Query uploaded document
-        self.test_document_query(chat_id)
+        # Tests 4-9: Simple message -> retrieval, agent message, and
+        # upload -> query (each pair must stay in order) run concurrently,
+        # along with the rename
+        scenarios = [
+            self._test_simple_message_and_retrieval(simple_chat_id),
+            self.test_agent_chat_message(agent_chat_id),
+            self._test_document_upload_and_query(document_chat_id)
+        ]
+        if not bulk:
+            scenarios.append(self.test_chat_rename(agent_chat_id))
+        await asyncio.gather(*scenarios)
         
-        # Test 9: Retrieve chat messages
-        self.test_chat_messages_retrieval(chat_id)
-        
-        # Test 10: Delete the chat
-        self.test_chat_deletion(chat_id)
+        # Test 10: Delete the chats
+        await self._delete_chat_fixtures(chat_ids, rename_chat_id=agent_chat_id if bulk else None)
         
         return self.generate_report()
     
+    async def _test_simple_message_and_retrieval(self, chat_id: int):
+        """Send a simple message, then retrieve the chat messages"""
+        await self.test_simple_chat_message(chat_id)
+        await self.test_chat_messages_retrieval(chat_id)
+    
+    async def _test_document_upload_and_query(self, chat_id: int):
+        """Upload the test document, then query its content"""
+        await self.test_document_upload(chat_id)
+        await self.test_document_query(chat_id)
+    
     def generate_report(self) -> Dict[str, any]:
         """Generate a comprehensive test report"""
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results if result.passed)
-        failed_tests = total_tests - passed_tests
+        self.flush_output()
         
-        total_duration = sum(result.duration for result in self.test_results)
+        # Aggregate counts, durations and result rows in a single pass
+        passed_tests = 0
+        total_duration = 0.0
+        test_results = []
+        failed_results = []
+        for result in self.test_results:
+            if result.passed:
+                passed_tests += 1
+            else:
+                failed_results.append(result)
+            total_duration += result.duration
+            test_results.append({
+                "test_name": result.test_name,
+                "passed": result.passed,
+                "message": result.message,
+                "duration": round(result.duration, 2),
+                "details": result.details
+            })
+        
+        total_tests = len(test_results)
+        failed_tests = total_tests - passed_tests
         
         report = {
             "summary": {
@@ -482,16 +691,7 @@ class CoreFunctionalityTester:
                 "success_rate": (passed_tests / total_tests * 100) if total_tests > 0 else 0,
                 "total_duration": round(total_duration, 2)
             },
-            "test_results": [
-                {
-                    "test_name": result.test_name,
-                    "passed": result.passed,
-                    "message": result.message,
-                    "duration": round(result.duration, 2),
-                    "details": result.details
-                }
-                for result in self.test_results
-            ]
+            "test_results": test_results
         }
         
         print("\n" + "=" * 60)
@@ -505,12 +705,44 @@ class CoreFunctionalityTester:
         
         if failed_tests > 0:
             print("\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result.passed:
-                    print(f"  - {result.test_name}: {result.message}")
+            for result in failed_results:
+                print(f"  - {result.test_name}: {result.message}")
         
         return report
 
+def _encode_report(report: Dict[str, any]) -> bytes:
+    """Serialize the report as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2).encode('utf-8')
+
+async def _write_report(path: str, report: Dict[str, any]):
+    """Write the JSON report without blocking the event loop"""
+    data = _encode_report(report)
+    if aiofiles is not None:
+        async with aiofiles.open(path, 'wb') as f:
+            await f.write(data)
+    else:
+        await asyncio.to_thread(Path(path).write_bytes, data)
+
+async def run_tests(base_url: str, timeout: int, bulk_fixtures: bool = False,
+                    output: Optional[str] = None) -> Dict[str, any]:
+    """Run the test suite, then save the report while closing the HTTP client"""
+    tester = CoreFunctionalityTester(base_url, timeout, bulk_fixtures)
+    report = None
+    try:
+        report = await tester.run_all_tests()
+    finally:
+        tester.flush_output()
+        pending = [tester.client.aclose()]
+        if output and report is not None:
+            pending.append(_write_report(output, report))
+        await asyncio.gather(*pending)
+    
+    if output:
+        print(f"\n📄 Test report saved to: {output}")
+    return report
+
 def main():
     """Main function to run the core functionality tests"""
     import argparse
@@ -519,20 +751,13 @@ def main():
     parser.add_argument("--url", required=True, help="Base URL of the deployed application")
     parser.add_argument("--timeout", type=int, default=30, help="Request timeout in seconds")
     parser.add_argument("--output", help="Output file for test results (JSON format)")
+    parser.add_argument("--bulk-fixtures", action="store_true",
+                        help="Create/rename/delete the test chat via /api/chats/_bulk/ (needs ENABLE_TEST_FIXTURES=true on the server)")
     
     args = parser.parse_args()
     
-    # Initialize tester
-    tester = CoreFunctionalityTester(args.url, args.timeout)
-    
-    # Run tests
-    report = tester.run_all_tests()
-    
-    # Save report if output file specified
-    if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
-        print(f"\n📄 Test report saved to: {args.output}")
+    # Run tests (and save the report if an output file is specified)
+    report = asyncio.run(run_tests(args.url, args.timeout, args.bulk_fixtures, args.output))
     
     # Exit with appropriate code
     sys.exit(0 if report['summary']['failed'] == 0 else 1)
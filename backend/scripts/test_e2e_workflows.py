@@ -11,111 +11,42 @@ This script tests comprehensive user workflows and validates all API endpoints:
 Requirements: 7.1, 6.3, 6.4
 """
 
-import os
+import io
 import sys
 import json
 import time
 import asyncio
 import aiohttp
-import tempfile
+import yarl
+import random
 import statistics
+import importlib.util
 from typing import Dict, List, Optional, Tuple, Any
+from collections import defaultdict
+from operator import attrgetter
 from dataclasses import dataclass, field
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
 
-@dataclass
-class WorkflowStep:
-    """Represents a single step in a workflow"""
-    name: str
-    description: str
-    function: callable
-    args: tuple = field(default_factory=tuple)
-    kwargs: dict = field(default_factory=dict)
-    critical: bool = True  # If True, workflow stops on failure
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
-class PerformanceMetrics:
-    """Performance metrics for API calls"""
-    endpoint: str
-    method: str
-    response_time: float
-    status_code: int
-    success: bool
-    error_message: Optional[str] = None
+# aiohttp.AsyncResolver needs the optional aiodns package
+AIODNS_AVAILABLE = importlib.util.find_spec("aiodns") is not None
 
-@dataclass
-class WorkflowResult:
-    """Result of a complete workflow execution"""
-    workflow_name: str
-    success: bool
-    steps_completed: int
-    total_steps: int
-    duration: float
-    performance_metrics: List[PerformanceMetrics] = field(default_factory=list)
-    error_message: Optional[str] = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-class EndToEndTester:
-    """Comprehensive end-to-end testing for RAG AI Agent"""
-    
-    def __init__(self, base_url: str, timeout: int = 60):
-        """
-        Initialize the E2E tester
-        
-        Args:
-            base_url: The base URL of the deployed application
-            timeout: Request timeout in seconds
-        """
-        self.base_url = base_url.rstrip('/')
-        self.timeout = timeout
-        self.performance_metrics: List[PerformanceMetrics] = []
-        self.workflow_results: List[WorkflowResult] = []
-        
-    def log_performance(self, endpoint: str, method: str, response_time: float, 
-                       status_code: int, success: bool, error_message: Optional[str] = None):
-        """Log performance metrics for an API call"""
-        metric = PerformanceMetrics(
-            endpoint=endpoint,
-            method=method,
-            response_time=response_time,
-            status_code=status_code,
-            success=success,
-            error_message=error_message
-        )
-        self.performance_metrics.append(metric)
-    
-    async def make_request(self, session: aiohttp.ClientSession, method: str, 
-                          endpoint: str, **kwargs) -> Tuple[bool, Dict, float]:
-        """Make an async HTTP request and log performance"""
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
-        
-        try:
-            async with session.request(method, url, timeout=self.timeout, **kwargs) as response:
-                duration = time.time() - start_time
-                
-                if response.content_type == 'application/json':
-                    data = await response.json()
-                else:
-                    data = {"text": await response.text()}
-                
-                success = 200 <= response.status < 300
-                self.log_performance(endpoint, method, duration, response.status, success)
-                
-                return success, data, duration
-                
-        except Exception as e:
-            duration = time.time() - start_time
-            self.log_performance(endpoint, method, duration, 0, False, str(e))
-            return False, {"error": str(e)}, duration
-    
-    def create_test_documents(self) -> List[str]:
-        """Create multiple test documents for comprehensive testing"""
-        documents = [
-            {
-                "filename": "ai_basics.txt",
-                "content": """
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Test documents uploaded by the workflows, kept as bytes so they are encoded only once
+_AI_BASICS = b"""
                 Artificial Intelligence Fundamentals
                 
                 Artificial Intelligence (AI) is the simulation of human intelligence in machines.
@@ -132,10 +63,8 @@ class EndToEndTester:
                 - Financial trading
                 - Virtual assistants
                 """
-            },
-            {
-                "filename": "ml_algorithms.txt", 
-                "content": """
+
+_ML_ALGORITHMS = b"""
                 Machine Learning Algorithms Overview
                 
                 Popular algorithms include:
@@ -151,10 +80,8 @@ class EndToEndTester:
                 - Recurrent Neural Networks (RNNs)
                 - Transformers
                 """
-            },
-            {
-                "filename": "data_science.txt",
-                "content": """
+
+_DATA_SCIENCE = b"""
                 Data Science Process
                 
                 The data science workflow typically includes:
@@ -173,45 +100,301 @@ class EndToEndTester:
                 - SQL for database queries
                 - Jupyter notebooks for analysis
                 """
-            }
-        ]
+
+TEST_DOCUMENTS = [_AI_BASICS, _ML_ALGORITHMS, _DATA_SCIENCE]
+
+# Successful response times kept per endpoint for its median; beyond this many
+# calls the median comes from a uniform random sample, so memory stays bounded
+ENDPOINT_SAMPLE_SIZE = 1024
+
+
+def _json_serialize(obj: Any) -> str:
+    """Serialize outbound json= request bodies, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _ndjson_line(record: Dict[str, Any]) -> bytes:
+    """Encode a record as one NDJSON line, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record).encode('utf-8') + b"\n"
+
+
+def _elapsed_since(start_ns: int) -> float:
+    """Seconds elapsed since a time.monotonic_ns() reading"""
+    return (time.monotonic_ns() - start_ns) * 1e-9
+
+
+def _summarize_response_times(response_times: List[float]) -> Dict[str, float]:
+    """Mean/median/min/max/stdev and p95/p99 of a list of response times"""
+    if np is not None:
+        arr = np.fromiter(response_times, dtype=np.float64, count=len(response_times))
+        p95, p99 = np.percentile(arr, [95, 99])
+        return {
+            "average_response_time": float(arr.mean()),
+            "median_response_time": float(np.median(arr)),
+            "min_response_time": float(arr.min()),
+            "max_response_time": float(arr.max()),
+            "std_deviation": float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
+            "p95": float(p95),
+            "p99": float(p99)
+        }
+    
+    if len(response_times) > 1:
+        # Inclusive quantiles match NumPy's default linear percentile
+        percentiles = statistics.quantiles(response_times, n=100, method='inclusive')
+        p95, p99 = percentiles[94], percentiles[98]
+    else:
+        p95 = p99 = response_times[0]
+    return {
+        "average_response_time": statistics.mean(response_times),
+        "median_response_time": statistics.median(response_times),
+        "min_response_time": min(response_times),
+        "max_response_time": max(response_times),
+        "std_deviation": statistics.stdev(response_times) if len(response_times) > 1 else 0.0,
+        "p95": p95,
+        "p99": p99
+    }
+
+
+# WorkflowResult fields of a report row, fetched in a single call per row
+_ROW_GETTER = attrgetter('workflow_name', 'success', 'steps_completed', 'total_steps',
+                         'duration', 'error_message')
+
+
+def _row_dict(fields: Tuple[str, bool, int, int, float, Optional[str]]) -> Dict[str, Any]:
+    """Report row for the WorkflowResult fields returned by _ROW_GETTER"""
+    workflow_name, success, steps_completed, total_steps, duration, error_message = fields
+    return {
+        "workflow_name": workflow_name,
+        "success": success,
+        "steps_completed": steps_completed,
+        "total_steps": total_steps,
+        "completion_rate": (steps_completed / total_steps * 100) if total_steps > 0 else 0,
+        "duration": round(duration, 2),
+        "error_message": error_message
+    }
+
+
+def _run_event_loop(coro):
+    """Run a coroutine on uvloop when it is installed (Linux), otherwise on the default asyncio loop"""
+    # uvloop.run only exists from uvloop 0.18; older releases use the default loop
+    if uvloop is not None and hasattr(uvloop, 'run') and sys.platform.startswith('linux'):
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+@dataclass
+class WorkflowStep:
+    """Represents a single step in a workflow"""
+    name: str
+    description: str
+    function: callable
+    args: tuple = field(default_factory=tuple)
+    kwargs: dict = field(default_factory=dict)
+    critical: bool = True  # If True, workflow stops on failure
+
+@dataclass(slots=True, frozen=True)
+class WorkflowResult:
+    """Result of a complete workflow execution"""
+    workflow_name: str
+    success: bool
+    steps_completed: int
+    total_steps: int
+    duration: float
+    error_message: Optional[str] = None
+
+@dataclass(slots=True)
+class EndpointStats:
+    """Running aggregates of the API calls made to one endpoint"""
+    total_calls: int = 0
+    successful_calls: int = 0
+    timeouts: int = 0
+    sum_response_time: float = 0.0
+    max_response_time: float = 0.0
+    # Reservoir sample of successful response times (see ENDPOINT_SAMPLE_SIZE)
+    response_time_sample: List[float] = field(default_factory=list)
+
+class EndToEndTester:
+    """Comprehensive end-to-end testing for RAG AI Agent"""
+    
+    def __init__(self, base_url: str, timeout: int = 60, collect_metrics: bool = True,
+                 concurrent_uploads: bool = True, metrics_log: Optional[str] = None):
+        """
+        Initialize the E2E tester
         
-        file_paths = []
-        for doc in documents:
-            temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False)
-            temp_file.write(doc["content"])
-            temp_file.close()
-            file_paths.append(temp_file.name)
+        Args:
+            base_url: The base URL of the deployed application
+            timeout: Request timeout in seconds
+            collect_metrics: Time and record every API call (off skips the per-request bookkeeping)
+            concurrent_uploads: Send the multi-document uploads to one chat concurrently
+                                (turn off for backends that cannot handle that)
+            metrics_log: Also write every API call metric to this NDJSON file (in memory,
+                         calls are only aggregated per endpoint)
+        """
+        self.base_url = base_url.rstrip('/')
+        # Parsed request URLs by endpoint path; the fixed endpoints are composed up front and
+        # per-chat ones on first use, so aiohttp never has to reparse a URL string
+        self._base = yarl.URL(self.base_url)
+        self._urls: Dict[str, yarl.URL] = {
+            endpoint: self._base / endpoint.lstrip('/')
+            for endpoint in ('/api/chats/', '/api/chats/new/')
+        }
+        self.timeout = timeout
+        # Built once for all requests; a short connect timeout fails unreachable hosts fast
+        self._timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=5, sock_read=timeout)
+        self._collect_metrics = collect_metrics
+        self.concurrent_uploads = concurrent_uploads
+        self.metrics_log = metrics_log
+        self._metrics_fp = None
+        # Per-endpoint aggregates, updated as calls are logged; the report is built from these
+        # (individual calls are only kept when streamed to metrics_log)
+        self._endpoint_stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.workflow_results: List[WorkflowResult] = []
+        # Test documents are uploaded from memory by every workflow
+        self._doc_bytes: List[bytes] = TEST_DOCUMENTS
+        
+    def log_performance(self, endpoint: str, method: str, response_time: float, 
+                       status_code: int, success: bool, error_message: Optional[str] = None,
+                       is_timeout: bool = False):
+        """Log performance metrics for an API call"""
+        stats = self._endpoint_stats[endpoint]
+        stats.total_calls += 1
+        if success:
+            stats.successful_calls += 1
+            stats.sum_response_time += response_time
+            if response_time > stats.max_response_time:
+                stats.max_response_time = response_time
+            sample = stats.response_time_sample
+            if len(sample) < ENDPOINT_SAMPLE_SIZE:
+                sample.append(response_time)
+            else:
+                slot = random.randrange(stats.successful_calls)
+                if slot < ENDPOINT_SAMPLE_SIZE:
+                    sample[slot] = response_time
+        elif is_timeout:
+            stats.timeouts += 1
+        
+        if self._metrics_fp is not None:
+            self._metrics_fp.write(_ndjson_line({
+                "endpoint": endpoint,
+                "method": method,
+                "response_time": response_time,
+                "status_code": status_code,
+                "success": success,
+                "error_message": error_message,
+                "is_timeout": is_timeout
+            }))
+    
+    def _url_for(self, endpoint: str) -> yarl.URL:
+        """Absolute URL for an endpoint path, composed once per endpoint"""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self._base / endpoint.lstrip('/')
+        return url
+    
+    async def make_request(self, session: aiohttp.ClientSession, method: str, 
+                          endpoint: str, expect_body: bool = True, **kwargs) -> Tuple[bool, Dict, float]:
+        """
+        Make an async HTTP request and log performance
+        
+        With expect_body=False the response body is drained (so the connection
+        can be reused) but not decoded, and an empty dict is returned as data.
+        """
+        url = self._url_for(endpoint)
+        collect_metrics = self._collect_metrics
+        if collect_metrics:
+            start_ns = time.monotonic_ns()
+        duration = 0.0
         
-        return file_paths
+        try:
+            async with session.request(method, url, timeout=self._timeout, **kwargs) as response:
+                if collect_metrics:
+                    duration = (time.monotonic_ns() - start_ns) * 1e-9
+                
+                if method == 'HEAD':
+                    data = {}
+                elif not expect_body:
+                    await response.read()
+                    data = {}
+                elif response.content_type == 'application/json':
+                    if orjson is not None:
+                        data = orjson.loads(await response.read())
+                    else:
+                        data = await response.json()
+                else:
+                    data = {"text": await response.text()}
+                
+                success = 200 <= response.status < 300
+                if collect_metrics:
+                    self.log_performance(endpoint, method, duration, response.status, success)
+                
+                return success, data, duration
+                
+        except asyncio.TimeoutError as e:
+            # Covers aiohttp.ServerTimeoutError too; tagged so the report need not parse messages
+            if collect_metrics:
+                duration = (time.monotonic_ns() - start_ns) * 1e-9
+                self.log_performance(endpoint, method, duration, 0, False, str(e), is_timeout=True)
+            return False, {"error": str(e)}, duration
+        except Exception as e:
+            if collect_metrics:
+                duration = (time.monotonic_ns() - start_ns) * 1e-9
+                self.log_performance(endpoint, method, duration, 0, False, str(e))
+            return False, {"error": str(e)}, duration
+    
+    def _make_connector(self, limit: int) -> aiohttp.TCPConnector:
+        """Build a connection pool that caches DNS lookups and keeps sockets alive between requests"""
+        return aiohttp.TCPConnector(
+            limit=limit,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            force_close=False,
+            resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+        )
+    
+    async def health_check(self, session: aiohttp.ClientSession) -> bool:
+        """Check the application is reachable with a bodiless HEAD request to the chats endpoint"""
+        try:
+            async with session.head(self._url_for('/api/chats/'), timeout=self._timeout) as response:
+                # GET-only routes may answer HEAD with 405, which still shows the app is up
+                return 200 <= response.status < 500
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+    
+    def get_test_document_bytes(self) -> List[bytes]:
+        """Contents of the test documents, in upload order"""
+        return self._doc_bytes
     
     async def workflow_new_user_complete_session(self, session: aiohttp.ClientSession) -> WorkflowResult:
         """Test complete new user workflow from start to finish"""
         workflow_name = "New User Complete Session"
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         steps_completed = 0
         total_steps = 12
         
         try:
             # Step 1: Check application health
-            success, _, _ = await self.make_request(session, 'GET', '/docs')
-            if not success:
+            if not await self.health_check(session):
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps, 
-                                    time.time() - start_time, error_message="Application not accessible")
+                                    _elapsed_since(start_ns), error_message="Application not accessible")
             steps_completed += 1
             
             # Step 2: List initial chats (should be empty or existing)
-            success, chats_data, _ = await self.make_request(session, 'GET', '/api/chats/')
+            success, _, _ = await self.make_request(session, 'GET', '/api/chats/', expect_body=False)
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot list chats")
+                                    _elapsed_since(start_ns), error_message="Cannot list chats")
             steps_completed += 1
             
             # Step 3: Create new chat
             success, chat_data, _ = await self.make_request(session, 'POST', '/api/chats/new/')
             if not success or 'chat_id' not in chat_data:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot create chat")
+                                    _elapsed_since(start_ns), error_message="Cannot create chat")
             chat_id = chat_data['chat_id']
             steps_completed += 1
             
@@ -219,108 +402,110 @@ class EndToEndTester:
             new_name = f"My AI Learning Session {int(time.time())}"
             success, _, _ = await self.make_request(
                 session, 'PUT', f'/api/chats/{chat_id}/rename/',
-                json={"name": new_name}
+                json={"name": new_name},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot rename chat")
+                                    _elapsed_since(start_ns), error_message="Cannot rename chat")
             steps_completed += 1
             
             # Step 5: Upload first document
-            test_files = self.create_test_documents()
-            try:
-                with open(test_files[0], 'rb') as f:
-                    form_data = aiohttp.FormData()
-                    form_data.add_field('query', 'I am uploading a document about AI basics')
-                    form_data.add_field('agent', 'false')
-                    form_data.add_field('files', f, filename='ai_basics.txt', content_type='text/plain')
-                    
-                    success, upload_data, _ = await self.make_request(
-                        session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data
-                    )
-                    if not success:
-                        return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                            time.time() - start_time, error_message="Cannot upload document")
-            finally:
-                # Clean up test files
-                for file_path in test_files:
-                    if os.path.exists(file_path):
-                        os.unlink(file_path)
-            steps_completed += 1
+            form_data = aiohttp.FormData()
+            form_data.add_field('query', 'I am uploading a document about AI basics')
+            form_data.add_field('agent', 'false')
+            form_data.add_field('files', io.BytesIO(self.get_test_document_bytes()[0]),
+                                filename='ai_basics.txt', content_type='text/plain')
             
-            # Step 6: Ask question about uploaded document
-            success, query_data, _ = await self.make_request(
-                session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'What are the main types of machine learning mentioned in the document?', 'agent': 'false'}
+            success, _, _ = await self.make_request(
+                session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data,
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot query document")
+                                    _elapsed_since(start_ns), error_message="Cannot upload document")
             steps_completed += 1
             
-            # Step 7: Use agent mode for calculation
-            success, agent_data, _ = await self.make_request(
+            # Step 6: Ask question about uploaded document
+            success, _, _ = await self.make_request(
                 session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'Calculate 15 * 23 + 47', 'agent': 'true'}
+                data={'query': 'What are the main types of machine learning mentioned in the document?', 'agent': 'false'},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot use agent mode")
+                                    _elapsed_since(start_ns), error_message="Cannot query document")
             steps_completed += 1
             
-            # Step 8: Ask for current time using agent
-            success, time_data, _ = await self.make_request(
-                session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'What is the current date and time?', 'agent': 'true'}
+            # Steps 7-8: Agent calculation and current time query (independent, run concurrently)
+            (agent_ok, _, _), (time_ok, _, _) = await asyncio.gather(
+                self.make_request(
+                    session, 'POST', f'/api/chats/{chat_id}/send/',
+                    data={'query': 'Calculate 15 * 23 + 47', 'agent': 'true'},
+                    expect_body=False
+                ),
+                self.make_request(
+                    session, 'POST', f'/api/chats/{chat_id}/send/',
+                    data={'query': 'What is the current date and time?', 'agent': 'true'},
+                    expect_body=False
+                )
             )
-            if not success:
+            if not agent_ok:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot get current time")
+                                    _elapsed_since(start_ns), error_message="Cannot use agent mode")
+            steps_completed += 1
+            if not time_ok:
+                return WorkflowResult(workflow_name, False, steps_completed, total_steps,
+                                    _elapsed_since(start_ns), error_message="Cannot get current time")
             steps_completed += 1
             
-            # Step 9: Retrieve all messages
-            success, messages_data, _ = await self.make_request(session, 'GET', f'/api/chats/{chat_id}/messages/')
+            # Steps 9 and 11: Retrieve all messages and list chats again (run concurrently)
+            (success, messages_data, _), (list_ok, final_chats, _) = await asyncio.gather(
+                self.make_request(session, 'GET', f'/api/chats/{chat_id}/messages/'),
+                self.make_request(session, 'GET', '/api/chats/')
+            )
+            
+            # Step 9: Check the retrieved messages
             if not success or not isinstance(messages_data, list):
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot retrieve messages")
+                                    _elapsed_since(start_ns), error_message="Cannot retrieve messages")
             steps_completed += 1
             
             # Step 10: Verify message count (should have multiple messages)
             if len(messages_data) < 6:  # At least 6 messages (3 user + 3 agent responses)
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Insufficient messages in chat")
+                                    _elapsed_since(start_ns), error_message="Insufficient messages in chat")
             steps_completed += 1
             
-            # Step 11: List chats again to verify our chat exists
-            success, final_chats, _ = await self.make_request(session, 'GET', '/api/chats/')
-            if not success:
+            # Step 11: Check the chat list
+            if not list_ok:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot list final chats")
+                                    _elapsed_since(start_ns), error_message="Cannot list final chats")
             
             # Verify our chat is in the list
             chat_found = any(chat.get('id') == chat_id for chat in final_chats)
             if not chat_found:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Created chat not found in list")
+                                    _elapsed_since(start_ns), error_message="Created chat not found in list")
             steps_completed += 1
             
             # Step 12: Clean up - delete the chat
-            success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete')
+            success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete', expect_body=False)
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot delete chat")
+                                    _elapsed_since(start_ns), error_message="Cannot delete chat")
             steps_completed += 1
             
-            return WorkflowResult(workflow_name, True, steps_completed, total_steps, time.time() - start_time)
+            return WorkflowResult(workflow_name, True, steps_completed, total_steps, _elapsed_since(start_ns))
             
         except Exception as e:
             return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                time.time() - start_time, error_message=str(e))
+                                _elapsed_since(start_ns), error_message=str(e))
     
     async def workflow_multi_document_research(self, session: aiohttp.ClientSession) -> WorkflowResult:
         """Test workflow with multiple document uploads and complex queries"""
         workflow_name = "Multi-Document Research Session"
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         steps_completed = 0
         total_steps = 8
         
@@ -329,80 +514,98 @@ class EndToEndTester:
             success, chat_data, _ = await self.make_request(session, 'POST', '/api/chats/new/')
             if not success or 'chat_id' not in chat_data:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot create research chat")
+                                    _elapsed_since(start_ns), error_message="Cannot create research chat")
             chat_id = chat_data['chat_id']
             steps_completed += 1
             
             # Step 2: Rename to research session
             success, _, _ = await self.make_request(
                 session, 'PUT', f'/api/chats/{chat_id}/rename/',
-                json={"name": "AI Research Session"}
+                json={"name": "AI Research Session"},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot rename research chat")
+                                    _elapsed_since(start_ns), error_message="Cannot rename research chat")
             steps_completed += 1
             
             # Step 3-5: Upload multiple documents
-            test_files = self.create_test_documents()
-            try:
-                for i, file_path in enumerate(test_files):
-                    with open(file_path, 'rb') as f:
-                        form_data = aiohttp.FormData()
-                        form_data.add_field('query', f'Uploading document {i+1} for research')
-                        form_data.add_field('agent', 'false')
-                        form_data.add_field('files', f, filename=f'research_doc_{i+1}.txt', content_type='text/plain')
-                        
-                        success, _, _ = await self.make_request(
-                            session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data
-                        )
-                        if not success:
-                            return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                                time.time() - start_time, error_message=f"Cannot upload document {i+1}")
-                    steps_completed += 1
-            finally:
-                # Clean up test files
-                for file_path in test_files:
-                    if os.path.exists(file_path):
-                        os.unlink(file_path)
+            upload_forms = []
+            for i, doc_bytes in enumerate(self.get_test_document_bytes()):
+                form_data = aiohttp.FormData()
+                form_data.add_field('query', f'Uploading document {i+1} for research')
+                form_data.add_field('agent', 'false')
+                form_data.add_field('files', io.BytesIO(doc_bytes), filename=f'research_doc_{i+1}.txt', content_type='text/plain')
+                upload_forms.append(form_data)
+            
+            if self.concurrent_uploads:
+                upload_results = await asyncio.gather(*[
+                    self.make_request(session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data,
+                                      expect_body=False)
+                    for form_data in upload_forms
+                ])
+            else:
+                upload_results = []
+                for form_data in upload_forms:
+                    result = await self.make_request(
+                        session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data,
+                        expect_body=False
+                    )
+                    upload_results.append(result)
+                    if not result[0]:
+                        break
+            
+            steps_completed += sum(1 for success, _, _ in upload_results if success)
+            for i, (success, _, _) in enumerate(upload_results):
+                if not success:
+                    return WorkflowResult(workflow_name, False, steps_completed, total_steps,
+                                        _elapsed_since(start_ns), error_message=f"Cannot upload document {i+1}")
             
             # Step 6: Complex cross-document query
-            success, complex_query, _ = await self.make_request(
+            success, _, _ = await self.make_request(
                 session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'Compare the machine learning algorithms mentioned across all uploaded documents and summarize the key differences', 'agent': 'false'}
+                data={'query': 'Compare the machine learning algorithms mentioned across all uploaded documents and summarize the key differences', 'agent': 'false'},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot perform complex query")
+                                    _elapsed_since(start_ns), error_message="Cannot perform complex query")
             steps_completed += 1
             
             # Step 7: Agent-assisted analysis
-            success, agent_analysis, _ = await self.make_request(
+            success, _, _ = await self.make_request(
                 session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'Based on the uploaded documents, calculate how many different AI applications are mentioned in total', 'agent': 'true'}
+                data={'query': 'Based on the uploaded documents, calculate how many different AI applications are mentioned in total', 'agent': 'true'},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot perform agent analysis")
+                                    _elapsed_since(start_ns), error_message="Cannot perform agent analysis")
             steps_completed += 1
             
             # Step 8: Clean up
-            success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete')
+            success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete', expect_body=False)
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Cannot delete research chat")
+                                    _elapsed_since(start_ns), error_message="Cannot delete research chat")
             steps_completed += 1
             
-            return WorkflowResult(workflow_name, True, steps_completed, total_steps, time.time() - start_time)
+            return WorkflowResult(workflow_name, True, steps_completed, total_steps, _elapsed_since(start_ns))
             
         except Exception as e:
             return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                time.time() - start_time, error_message=str(e))
+                                _elapsed_since(start_ns), error_message=str(e))
     
-    async def workflow_concurrent_users(self, num_users: int = 3) -> WorkflowResult:
-        """Test concurrent user sessions"""
+    async def workflow_concurrent_users(self, session: aiohttp.ClientSession, num_users: int = 3,
+                                        max_in_flight: Optional[int] = None) -> WorkflowResult:
+        """
+        Test concurrent user sessions (sharing the caller's session and connection pool)
+        
+        At most max_in_flight user sessions (default: all of them) run at once, so
+        large user counts measure the server rather than client-side queueing.
+        """
         workflow_name = f"Concurrent Users ({num_users} users)"
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         async def single_user_session(session: aiohttp.ClientSession, user_id: int) -> bool:
             """Simulate a single user session"""
@@ -417,7 +620,8 @@ class EndToEndTester:
                 # Rename chat
                 success, _, _ = await self.make_request(
                     session, 'PUT', f'/api/chats/{chat_id}/rename/',
-                    json={"name": f"User {user_id} Session"}
+                    json={"name": f"User {user_id} Session"},
+                    expect_body=False
                 )
                 if not success:
                     return False
@@ -425,54 +629,61 @@ class EndToEndTester:
                 # Send message
                 success, _, _ = await self.make_request(
                     session, 'POST', f'/api/chats/{chat_id}/send/',
-                    data={'query': f'Hello from user {user_id}', 'agent': 'false'}
+                    data={'query': f'Hello from user {user_id}', 'agent': 'false'},
+                    expect_body=False
                 )
                 if not success:
                     return False
                 
                 # Clean up
-                success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete')
+                success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete', expect_body=False)
                 return success
                 
             except Exception:
                 return False
         
+        semaphore = asyncio.Semaphore(max_in_flight or num_users)
+        
+        async def bounded_user_session(session: aiohttp.ClientSession, user_id: int) -> bool:
+            async with semaphore:
+                return await single_user_session(session, user_id)
+        
         try:
-            connector = aiohttp.TCPConnector(limit=num_users * 2)
-            async with aiohttp.ClientSession(connector=connector) as session:
-                # Run concurrent user sessions
-                tasks = [single_user_session(session, i) for i in range(num_users)]
+            # Run concurrent user sessions
+            if sys.version_info >= (3, 11):
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(bounded_user_session(session, i)) for i in range(num_users)]
+                results = [task.result() for task in tasks]
+            else:
+                tasks = [bounded_user_session(session, i) for i in range(num_users)]
                 results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                successful_users = sum(1 for result in results if result is True)
-                
-                return WorkflowResult(
-                    workflow_name, 
-                    successful_users == num_users,
-                    successful_users,
-                    num_users,
-                    time.time() - start_time,
-                    error_message=f"Only {successful_users}/{num_users} users completed successfully" if successful_users < num_users else None
-                )
-                
+            
+            successful_users = sum(1 for result in results if result is True)
+            
+            return WorkflowResult(
+                workflow_name, 
+                successful_users == num_users,
+                successful_users,
+                num_users,
+                _elapsed_since(start_ns),
+                error_message=f"Only {successful_users}/{num_users} users completed successfully" if successful_users < num_users else None
+            )
+            
         except Exception as e:
-            return WorkflowResult(workflow_name, False, 0, num_users, time.time() - start_time, error_message=str(e))
+            return WorkflowResult(workflow_name, False, 0, num_users, _elapsed_since(start_ns), error_message=str(e))
     
     async def test_api_endpoints_comprehensive(self, session: aiohttp.ClientSession) -> WorkflowResult:
         """Test all API endpoints comprehensively"""
         workflow_name = "Comprehensive API Endpoint Testing"
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         steps_completed = 0
         total_steps = 10
         
         try:
-            # Test 1: Health check endpoints
-            endpoints_to_test = ['/docs', '/openapi.json']
-            for endpoint in endpoints_to_test:
-                success, _, _ = await self.make_request(session, 'GET', endpoint)
-                if not success and endpoint == '/docs':  # /docs is critical
-                    return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                        time.time() - start_time, error_message=f"Critical endpoint {endpoint} failed")
+            # Test 1: Health check
+            if not await self.health_check(session):
+                return WorkflowResult(workflow_name, False, steps_completed, total_steps,
+                                    _elapsed_since(start_ns), error_message="Health check failed")
             steps_completed += 1
             
             # Test 2: Chat CRUD operations
@@ -480,252 +691,263 @@ class EndToEndTester:
             success, chat_data, _ = await self.make_request(session, 'POST', '/api/chats/new/')
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Chat creation failed")
+                                    _elapsed_since(start_ns), error_message="Chat creation failed")
             chat_id = chat_data['chat_id']
             steps_completed += 1
             
             # Read (list)
-            success, _, _ = await self.make_request(session, 'GET', '/api/chats/')
+            success, _, _ = await self.make_request(session, 'GET', '/api/chats/', expect_body=False)
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Chat listing failed")
+                                    _elapsed_since(start_ns), error_message="Chat listing failed")
             steps_completed += 1
             
             # Update (rename)
             success, _, _ = await self.make_request(
                 session, 'PUT', f'/api/chats/{chat_id}/rename/',
-                json={"name": "API Test Chat"}
+                json={"name": "API Test Chat"},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Chat rename failed")
+                                    _elapsed_since(start_ns), error_message="Chat rename failed")
             steps_completed += 1
             
             # Test 3: Message operations
             # Send simple message
             success, _, _ = await self.make_request(
                 session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'Test message', 'agent': 'false'}
+                data={'query': 'Test message', 'agent': 'false'},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Simple message failed")
+                                    _elapsed_since(start_ns), error_message="Simple message failed")
             steps_completed += 1
             
             # Send agent message
             success, _, _ = await self.make_request(
                 session, 'POST', f'/api/chats/{chat_id}/send/',
-                data={'query': 'What is 2+2?', 'agent': 'true'}
+                data={'query': 'What is 2+2?', 'agent': 'true'},
+                expect_body=False
             )
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Agent message failed")
+                                    _elapsed_since(start_ns), error_message="Agent message failed")
             steps_completed += 1
             
             # Get messages
-            success, messages, _ = await self.make_request(session, 'GET', f'/api/chats/{chat_id}/messages/')
+            success, _, _ = await self.make_request(session, 'GET', f'/api/chats/{chat_id}/messages/', expect_body=False)
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Message retrieval failed")
+                                    _elapsed_since(start_ns), error_message="Message retrieval failed")
             steps_completed += 1
             
             # Test 4: File upload
-            test_files = self.create_test_documents()
-            try:
-                with open(test_files[0], 'rb') as f:
-                    form_data = aiohttp.FormData()
-                    form_data.add_field('query', 'API test file upload')
-                    form_data.add_field('agent', 'false')
-                    form_data.add_field('files', f, filename='api_test.txt', content_type='text/plain')
-                    
-                    success, _, _ = await self.make_request(
-                        session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data
-                    )
-                    if not success:
-                        return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                            time.time() - start_time, error_message="File upload failed")
-            finally:
-                for file_path in test_files:
-                    if os.path.exists(file_path):
-                        os.unlink(file_path)
+            form_data = aiohttp.FormData()
+            form_data.add_field('query', 'API test file upload')
+            form_data.add_field('agent', 'false')
+            form_data.add_field('files', io.BytesIO(self.get_test_document_bytes()[0]),
+                                filename='api_test.txt', content_type='text/plain')
+            
+            success, _, _ = await self.make_request(
+                session, 'POST', f'/api/chats/{chat_id}/send/', data=form_data,
+                expect_body=False
+            )
+            if not success:
+                return WorkflowResult(workflow_name, False, steps_completed, total_steps,
+                                    _elapsed_since(start_ns), error_message="File upload failed")
             steps_completed += 1
             
             # Test 5: Error handling - invalid chat ID
-            success, _, _ = await self.make_request(session, 'GET', '/api/chats/99999/messages/')
+            success, _, _ = await self.make_request(session, 'GET', '/api/chats/99999/messages/', expect_body=False)
             # This should fail gracefully (404), not crash
             steps_completed += 1
             
             # Test 6: Clean up - Delete chat
-            success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete')
+            success, _, _ = await self.make_request(session, 'DELETE', f'/api/chats/{chat_id}/delete', expect_body=False)
             if not success:
                 return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                    time.time() - start_time, error_message="Chat deletion failed")
+                                    _elapsed_since(start_ns), error_message="Chat deletion failed")
             steps_completed += 1
             
-            return WorkflowResult(workflow_name, True, steps_completed, total_steps, time.time() - start_time)
+            return WorkflowResult(workflow_name, True, steps_completed, total_steps, _elapsed_since(start_ns))
             
         except Exception as e:
             return WorkflowResult(workflow_name, False, steps_completed, total_steps,
-                                time.time() - start_time, error_message=str(e))
+                                _elapsed_since(start_ns), error_message=str(e))
     
-    async def run_performance_tests(self, session: aiohttp.ClientSession) -> Dict[str, Any]:
-        """Run performance and load tests"""
+    async def _timed_get(self, session: aiohttp.ClientSession, endpoint: str) -> Optional[float]:
+        """GET an endpoint, returning the elapsed time on success and None on failure"""
+        start_ns = time.monotonic_ns()
+        success, _, _ = await self.make_request(session, 'GET', endpoint, expect_body=False)
+        return _elapsed_since(start_ns) if success else None
+    
+    async def run_performance_tests(self, session: aiohttp.ClientSession, sequential: bool = False) -> Dict[str, Any]:
+        """
+        Run performance and load tests
+        
+        The requests are sent as one concurrent burst, so the timings reflect
+        queueing under load; sequential=True sends them one after another.
+        """
         print("🚀 Running Performance Tests...")
         
-        # Test response times under normal load
-        response_times = []
-        for i in range(10):
-            start_time = time.time()
-            success, _, _ = await self.make_request(session, 'GET', '/api/chats/')
-            if success:
-                response_times.append(time.time() - start_time)
+        # Test response times under load
+        if sequential:
+            timings = [await self._timed_get(session, '/api/chats/') for _ in range(10)]
+        else:
+            timings = await asyncio.gather(*[self._timed_get(session, '/api/chats/') for _ in range(10)])
+        response_times = [timing for timing in timings if timing is not None]
         
         # Calculate performance statistics
         if response_times:
-            perf_stats = {
-                "average_response_time": statistics.mean(response_times),
-                "median_response_time": statistics.median(response_times),
-                "min_response_time": min(response_times),
-                "max_response_time": max(response_times),
-                "std_deviation": statistics.stdev(response_times) if len(response_times) > 1 else 0
-            }
+            perf_stats = _summarize_response_times(response_times)
         else:
             perf_stats = {"error": "No successful requests for performance measurement"}
         
         return perf_stats
     
-    async def run_all_workflows(self) -> Dict[str, Any]:
+    async def run_all_workflows(self, concurrent_users: int = 3, max_in_flight: Optional[int] = None) -> Dict[str, Any]:
         """Run all end-to-end workflow tests"""
         print("🚀 Starting End-to-End Workflow Tests")
         print(f"Testing application at: {self.base_url}")
         print("-" * 60)
         
-        connector = aiohttp.TCPConnector(limit=20)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            # Run individual workflows
-            workflows = [
-                self.workflow_new_user_complete_session(session),
-                self.workflow_multi_document_research(session),
-                self.test_api_endpoints_comprehensive(session),
-                self.workflow_concurrent_users(3)
-            ]
-            
-            # Execute workflows
-            workflow_results = await asyncio.gather(*workflows, return_exceptions=True)
-            
-            # Process results
-            for result in workflow_results:
-                if isinstance(result, Exception):
-                    self.workflow_results.append(WorkflowResult(
-                        "Unknown Workflow", False, 0, 1, 0.0, error_message=str(result)
-                    ))
-                else:
-                    self.workflow_results.append(result)
-            
-            # Run performance tests
-            performance_stats = await self.run_performance_tests(session)
+        if self.metrics_log:
+            self._metrics_fp = open(self.metrics_log, 'wb')
+        try:
+            # One pool for every workflow, sized for the users allowed in flight as well
+            connector = self._make_connector(max(20, (max_in_flight or concurrent_users) * 2))
+            async with aiohttp.ClientSession(connector=connector, json_serialize=_json_serialize) as session:
+                # Run individual workflows
+                workflows = [
+                    self.workflow_new_user_complete_session(session),
+                    self.workflow_multi_document_research(session),
+                    self.test_api_endpoints_comprehensive(session),
+                    self.workflow_concurrent_users(session, concurrent_users, max_in_flight)
+                ]
+                
+                # Execute workflows
+                workflow_results = await asyncio.gather(*workflows, return_exceptions=True)
+                
+                # Process results
+                for result in workflow_results:
+                    if isinstance(result, Exception):
+                        self.workflow_results.append(WorkflowResult(
+                            "Unknown Workflow", False, 0, 1, 0.0, error_message=str(result)
+                        ))
+                    else:
+                        self.workflow_results.append(result)
+                
+                # Run performance tests
+                performance_stats = await self.run_performance_tests(session)
+        finally:
+            if self._metrics_fp is not None:
+                self._metrics_fp.close()
+                self._metrics_fp = None
         
         return self.generate_comprehensive_report(performance_stats)
     
     def generate_comprehensive_report(self, performance_stats: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive test report"""
-        total_workflows = len(self.workflow_results)
-        successful_workflows = sum(1 for result in self.workflow_results if result.success)
+        # Performance metrics analysis: totals over the running per-endpoint aggregates
+        total_requests = 0
+        successful_count = 0
+        timeout_count = 0
+        response_time_sum = 0.0
+        max_response_time = 0
+        for stats in self._endpoint_stats.values():
+            total_requests += stats.total_calls
+            successful_count += stats.successful_calls
+            timeout_count += stats.timeouts
+            response_time_sum += stats.sum_response_time
+            if stats.max_response_time > max_response_time:
+                max_response_time = stats.max_response_time
+        failed_count = total_requests - successful_count
+        have_requests = total_requests > 0
+        avg_response_time = response_time_sum / successful_count if successful_count else 0
+        api_success_rate = (successful_count / total_requests * 100) if have_requests else 0
         
-        # Performance metrics analysis
-        successful_requests = [m for m in self.performance_metrics if m.success]
-        failed_requests = [m for m in self.performance_metrics if not m.success]
-        
-        if successful_requests:
-            avg_response_time = statistics.mean([m.response_time for m in successful_requests])
-            max_response_time = max([m.response_time for m in successful_requests])
-        else:
-            avg_response_time = 0
-            max_response_time = 0
+        # Workflow rows, success count and failures in one pass
+        total_workflows = len(self.workflow_results)
+        successful_workflows = 0
+        workflow_rows = []
+        failed_workflows = []
+        for result in self.workflow_results:
+            if result.success:
+                successful_workflows += 1
+            else:
+                failed_workflows.append(result)
+            workflow_rows.append(_row_dict(_ROW_GETTER(result)))
+        failed_workflow_count = len(failed_workflows)
+        success_rate = (successful_workflows / total_workflows * 100) if total_workflows else 0
         
         report = {
             "summary": {
                 "total_workflows": total_workflows,
                 "successful_workflows": successful_workflows,
-                "failed_workflows": total_workflows - successful_workflows,
-                "success_rate": (successful_workflows / total_workflows * 100) if total_workflows > 0 else 0,
-                "total_api_calls": len(self.performance_metrics),
-                "successful_api_calls": len(successful_requests),
-                "failed_api_calls": len(failed_requests),
-                "api_success_rate": (len(successful_requests) / len(self.performance_metrics) * 100) if self.performance_metrics else 0,
+                "failed_workflows": failed_workflow_count,
+                "success_rate": success_rate,
+                "total_api_calls": total_requests,
+                "successful_api_calls": successful_count,
+                "failed_api_calls": failed_count,
+                "api_success_rate": api_success_rate,
                 "average_response_time": round(avg_response_time, 3),
                 "max_response_time": round(max_response_time, 3)
             },
-            "workflow_results": [
-                {
-                    "workflow_name": result.workflow_name,
-                    "success": result.success,
-                    "steps_completed": result.steps_completed,
-                    "total_steps": result.total_steps,
-                    "completion_rate": (result.steps_completed / result.total_steps * 100) if result.total_steps > 0 else 0,
-                    "duration": round(result.duration, 2),
-                    "error_message": result.error_message
-                }
-                for result in self.workflow_results
-            ],
+            "workflow_results": workflow_rows,
             "performance_analysis": performance_stats,
             "api_endpoint_analysis": self._analyze_api_endpoints(),
             "reliability_metrics": {
-                "error_rate": (len(failed_requests) / len(self.performance_metrics) * 100) if self.performance_metrics else 0,
-                "timeout_rate": len([m for m in failed_requests if "timeout" in str(m.error_message).lower()]) / len(self.performance_metrics) * 100 if self.performance_metrics else 0
+                "error_rate": (failed_count / total_requests * 100) if have_requests else 0,
+                "timeout_rate": (timeout_count / total_requests * 100) if have_requests else 0
             }
         }
         
-        # Print summary
-        print("\n" + "=" * 60)
-        print("📊 END-TO-END TEST SUMMARY")
-        print("=" * 60)
-        print(f"Workflows: {successful_workflows}/{total_workflows} successful ({report['summary']['success_rate']:.1f}%)")
-        print(f"API Calls: {len(successful_requests)}/{len(self.performance_metrics)} successful ({report['summary']['api_success_rate']:.1f}%)")
-        print(f"Average Response Time: {avg_response_time:.3f}s")
-        print(f"Max Response Time: {max_response_time:.3f}s")
+        # Print summary in a single write
+        rule = "=" * 60
+        sys.stdout.write(f"""
+{rule}
+📊 END-TO-END TEST SUMMARY
+{rule}
+Workflows: {successful_workflows}/{total_workflows} successful ({success_rate:.1f}%)
+API Calls: {successful_count}/{total_requests} successful ({api_success_rate:.1f}%)
+Average Response Time: {avg_response_time:.3f}s
+Max Response Time: {max_response_time:.3f}s
+""")
         
-        if total_workflows - successful_workflows > 0:
+        if failed_workflows:
             print("\n❌ FAILED WORKFLOWS:")
-            for result in self.workflow_results:
-                if not result.success:
-                    print(f"  - {result.workflow_name}: {result.error_message}")
+            for result in failed_workflows:
+                print(f"  - {result.workflow_name}: {result.error_message}")
         
         return report
     
     def _analyze_api_endpoints(self) -> Dict[str, Any]:
         """Analyze API endpoint performance"""
-        endpoint_stats = {}
-        
-        for metric in self.performance_metrics:
-            endpoint = metric.endpoint
-            if endpoint not in endpoint_stats:
-                endpoint_stats[endpoint] = {
-                    "total_calls": 0,
-                    "successful_calls": 0,
-                    "response_times": []
+        endpoint_analysis = {}
+        for endpoint, stats in self._endpoint_stats.items():
+            successful_calls = stats.successful_calls
+            if successful_calls:
+                endpoint_analysis[endpoint] = {
+                    "total_calls": stats.total_calls,
+                    "successful_calls": successful_calls,
+                    "avg_response_time": stats.sum_response_time / successful_calls,
+                    "median_response_time": statistics.median(stats.response_time_sample),
+                    "max_response_time": stats.max_response_time,
+                    "success_rate": (successful_calls / stats.total_calls) * 100
                 }
-            
-            endpoint_stats[endpoint]["total_calls"] += 1
-            if metric.success:
-                endpoint_stats[endpoint]["successful_calls"] += 1
-                endpoint_stats[endpoint]["response_times"].append(metric.response_time)
-        
-        # Calculate statistics for each endpoint
-        for endpoint, stats in endpoint_stats.items():
-            if stats["response_times"]:
-                stats["avg_response_time"] = statistics.mean(stats["response_times"])
-                stats["max_response_time"] = max(stats["response_times"])
-                stats["success_rate"] = (stats["successful_calls"] / stats["total_calls"]) * 100
             else:
-                stats["avg_response_time"] = 0
-                stats["max_response_time"] = 0
-                stats["success_rate"] = 0
-            
-            # Remove raw response times from final report
-            del stats["response_times"]
+                endpoint_analysis[endpoint] = {
+                    "total_calls": stats.total_calls,
+                    "successful_calls": 0,
+                    "avg_response_time": 0,
+                    "median_response_time": 0,
+                    "max_response_time": 0,
+                    "success_rate": 0
+                }
         
-        return endpoint_stats
+        return endpoint_analysis
 
 def main():
     """Main function to run end-to-end workflow tests"""
@@ -736,20 +958,32 @@ def main():
     parser.add_argument("--timeout", type=int, default=60, help="Request timeout in seconds")
     parser.add_argument("--output", help="Output file for test results (JSON format)")
     parser.add_argument("--concurrent-users", type=int, default=3, help="Number of concurrent users to simulate")
+    parser.add_argument("--no-metrics", action="store_true", help="Skip per-request timing and API call metrics")
+    parser.add_argument("--sequential-uploads", action="store_true",
+                        help="Upload the research documents one at a time instead of concurrently")
+    parser.add_argument("--max-in-flight", type=int,
+                        help="Maximum simulated users running at once (default: all concurrent users)")
+    parser.add_argument("--metrics-log",
+                        help="Write per-request metrics to this NDJSON file (the report only has per-endpoint aggregates)")
     
     args = parser.parse_args()
     
     # Initialize tester
-    tester = EndToEndTester(args.url, args.timeout)
+    tester = EndToEndTester(args.url, args.timeout, collect_metrics=not args.no_metrics,
+                            concurrent_uploads=not args.sequential_uploads, metrics_log=args.metrics_log)
     
     # Run tests
     try:
-        report = asyncio.run(tester.run_all_workflows())
+        report = _run_event_loop(tester.run_all_workflows(args.concurrent_users, args.max_in_flight))
         
         # Save report if output file specified
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(report, f, indent=2)
+            if orjson is not None:
+                with open(args.output, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(args.output, 'w') as f:
+                    json.dump(report, f, indent=2)
             print(f"\n📄 Test report saved to: {args.output}")
         
         # Exit with appropriate code
@@ -12,81 +12,152 @@ Usage:
 """
 
 import argparse
+import asyncio
+import importlib.util
 import json
-import requests
+import httpx
+import socket
 import sys
 import time
 from typing import Dict, Any, Optional
-from urllib.parse import urljoin
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Preflight request headers sent by test_cors_headers (the Origin header is added per test)
+_CORS_REQ_HEADERS = {
+    'Access-Control-Request-Method': 'POST',
+    'Access-Control-Request-Headers': 'Content-Type, Authorization'
+}
+
+# CORS response headers reported by test_cors_headers, lowercase
+_CORS_RESP_HEADERS = (
+    'access-control-allow-origin',
+    'access-control-allow-methods',
+    'access-control-allow-headers',
+    'access-control-allow-credentials'
+)
 
 
 class FastAPITester:
     """Test suite for FastAPI deployment"""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, timeout: int = 30):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
-        self.session.timeout = 30
+        # Absolute URLs of every endpoint the tests call, parsed once
+        self.urls = {
+            path: httpx.URL(self.base_url + path)
+            for path in ("/", "/openapi.json", "/api/chats/", "/api/chats/new/", "/docs", "/redoc")
+        }
+        # One pooled client (HTTP/2 when available) shared by the concurrently running tests
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=16)
+            )
+        )
+        
+    async def _summarize_openapi(self, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Extract the top-level fields, info title/version and path count from a
+        streamed OpenAPI document
+        
+        With ijson the document is parsed incrementally and parsing stops once
+        the paths section has been counted, without building the schema dict.
+        """
+        summary = {"fields": set(), "title": "Unknown", "version": "Unknown", "endpoint_count": 0}
         
-    def test_openapi_schema(self) -> Dict[str, Any]:
+        if ijson is None:
+            schema = json.loads(await response.aread())
+            summary["fields"].update(schema)
+            summary["title"] = schema.get('info', {}).get('title', 'Unknown')
+            summary["version"] = schema.get('info', {}).get('version', 'Unknown')
+            summary["endpoint_count"] = len(schema.get('paths', {}))
+            return summary
+        
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events)
+        paths_done = False
+        async for chunk in response.aiter_bytes():
+            if paths_done:
+                continue  # drain the rest of the body so the connection can be reused
+            parser.send(chunk)
+            for prefix, event, value in events:
+                if prefix == '' and event == 'map_key':
+                    summary["fields"].add(value)
+                elif prefix == 'paths':
+                    if event == 'map_key':
+                        summary["endpoint_count"] += 1
+                    elif event == 'end_map':
+                        paths_done = True
+                elif prefix == 'info.title':
+                    summary["title"] = value
+                elif prefix == 'info.version':
+                    summary["version"] = value
+            del events[:]
+        if not paths_done:
+            parser.close()
+        return summary
+    
+    async def test_openapi_schema(self) -> Dict[str, Any]:
         """Test OpenAPI schema endpoint"""
         print("🔍 Testing OpenAPI schema...")
         
         try:
-            response = self.session.get(urljoin(self.base_url, "/openapi.json"))
-            
-            if response.status_code == 200:
-                schema = response.json()
+            async with self.client.stream("GET", self.urls["/openapi.json"]) as response:
+                if response.status_code != 200:
+                    print(f"❌ OpenAPI schema endpoint returned status {response.status_code}")
+                    return {"status": "error", "message": f"HTTP {response.status_code}"}
                 
-                # Validate schema structure
-                required_fields = ["openapi", "info", "paths"]
-                missing_fields = [field for field in required_fields if field not in schema]
+                summary = await self._summarize_openapi(response)
+            
+            # Validate schema structure
+            required_fields = ["openapi", "info", "paths"]
+            missing_fields = [field for field in required_fields if field not in summary["fields"]]
+            
+            if not missing_fields:
+                print("✅ OpenAPI schema is valid")
+                print(f"   API Title: {summary['title']}")
+                print(f"   API Version: {summary['version']}")
+                print(f"   Endpoints: {summary['endpoint_count']}")
                 
-                if not missing_fields:
-                    print("✅ OpenAPI schema is valid")
-                    print(f"   API Title: {schema.get('info', {}).get('title', 'Unknown')}")
-                    print(f"   API Version: {schema.get('info', {}).get('version', 'Unknown')}")
-                    print(f"   Endpoints: {len(schema.get('paths', {}))}")
-                    
-                    return {
-                        "status": "success",
-                        "schema": schema,
-                        "endpoint_count": len(schema.get('paths', {}))
-                    }
-                else:
-                    print(f"❌ OpenAPI schema missing required fields: {missing_fields}")
-                    return {"status": "error", "message": f"Missing fields: {missing_fields}"}
+                return {
+                    "status": "success",
+                    "title": summary["title"],
+                    "version": summary["version"],
+                    "endpoint_count": summary["endpoint_count"]
+                }
             else:
-                print(f"❌ OpenAPI schema endpoint returned status {response.status_code}")
-                return {"status": "error", "message": f"HTTP {response.status_code}"}
+                print(f"❌ OpenAPI schema missing required fields: {missing_fields}")
+                return {"status": "error", "message": f"Missing fields: {missing_fields}"}
                 
         except Exception as e:
             print(f"❌ Failed to fetch OpenAPI schema: {e}")
             return {"status": "error", "message": str(e)}
     
-    def test_cors_headers(self, test_origin: str = "https://example.com") -> Dict[str, Any]:
+    async def test_cors_headers(self, test_origin: str = "https://example.com") -> Dict[str, Any]:
         """Test CORS configuration"""
         print(f"🔍 Testing CORS headers with origin: {test_origin}")
         
         try:
             # Test preflight request
-            headers = {
-                'Origin': test_origin,
-                'Access-Control-Request-Method': 'POST',
-                'Access-Control-Request-Headers': 'Content-Type, Authorization'
-            }
+            headers = {'Origin': test_origin, **_CORS_REQ_HEADERS}
             
-            response = self.session.options(
-                urljoin(self.base_url, "/api/chats/"),
-                headers=headers
-            )
+            response = await self.client.options(self.urls["/api/chats/"], headers=headers)
             
-            cors_headers = {
-                'access-control-allow-origin': response.headers.get('Access-Control-Allow-Origin'),
-                'access-control-allow-methods': response.headers.get('Access-Control-Allow-Methods'),
-                'access-control-allow-headers': response.headers.get('Access-Control-Allow-Headers'),
-                'access-control-allow-credentials': response.headers.get('Access-Control-Allow-Credentials'),
-            }
+            # One walk over the response headers; absent ones stay None
+            cors_headers = dict.fromkeys(_CORS_RESP_HEADERS)
+            for name, value in response.headers.items():
+                name = name.lower()
+                if name in cors_headers:
+                    cors_headers[name] = value
             
             # Check if CORS is properly configured
             allow_origin = cors_headers['access-control-allow-origin']
@@ -115,36 +186,39 @@ class FastAPITester:
             print(f"❌ CORS test failed: {e}")
             return {"status": "error", "message": str(e)}
     
-    def test_fastapi_docs(self) -> Dict[str, Any]:
+    async def test_fastapi_docs(self) -> Dict[str, Any]:
         """Test FastAPI documentation endpoints"""
         print("🔍 Testing FastAPI documentation endpoints...")
         
         results = {}
         
-        # Test Swagger UI
-        try:
-            docs_response = self.session.get(urljoin(self.base_url, "/docs"))
-            if docs_response.status_code == 200 and "swagger" in docs_response.text.lower():
-                print("✅ Swagger UI documentation accessible")
-                results["swagger"] = True
-            else:
-                print(f"❌ Swagger UI not accessible (status: {docs_response.status_code})")
-                results["swagger"] = False
-        except Exception as e:
-            print(f"❌ Swagger UI test failed: {e}")
+        # Fetch both pages at once; exceptions are reported per page below
+        docs_response, redoc_response = await asyncio.gather(
+            self.client.get(self.urls["/docs"]),
+            self.client.get(self.urls["/redoc"]),
+            return_exceptions=True
+        )
+        
+        # Test Swagger UI (checked on the raw bytes; the markup contains the literal class name)
+        if isinstance(docs_response, Exception):
+            print(f"❌ Swagger UI test failed: {docs_response}")
+            results["swagger"] = False
+        elif docs_response.status_code == 200 and b"swagger-ui" in docs_response.content:
+            print("✅ Swagger UI documentation accessible")
+            results["swagger"] = True
+        else:
+            print(f"❌ Swagger UI not accessible (status: {docs_response.status_code})")
             results["swagger"] = False
         
         # Test ReDoc
-        try:
-            redoc_response = self.session.get(urljoin(self.base_url, "/redoc"))
-            if redoc_response.status_code == 200 and "redoc" in redoc_response.text.lower():
-                print("✅ ReDoc documentation accessible")
-                results["redoc"] = True
-            else:
-                print(f"❌ ReDoc not accessible (status: {redoc_response.status_code})")
-                results["redoc"] = False
-        except Exception as e:
-            print(f"❌ ReDoc test failed: {e}")
+        if isinstance(redoc_response, Exception):
+            print(f"❌ ReDoc test failed: {redoc_response}")
+            results["redoc"] = False
+        elif redoc_response.status_code == 200 and b"redoc" in redoc_response.content.lower():
+            print("✅ ReDoc documentation accessible")
+            results["redoc"] = True
+        else:
+            print(f"❌ ReDoc not accessible (status: {redoc_response.status_code})")
             results["redoc"] = False
         
         return {
@@ -152,7 +226,7 @@ class FastAPITester:
             "results": results
         }
     
-    def test_api_endpoints(self) -> Dict[str, Any]:
+    async def test_api_endpoints(self) -> Dict[str, Any]:
         """Test specific API endpoints"""
         print("🔍 Testing API endpoints...")
         
@@ -161,39 +235,41 @@ class FastAPITester:
             ("POST", "/api/chats/new/", "Create new chat"),
         ]
         
-        results = {}
-        
-        for method, endpoint, description in endpoints:
-            try:
-                url = urljoin(self.base_url, endpoint)
-                
-                if method == "GET":
-                    response = self.session.get(url)
-                elif method == "POST":
-                    response = self.session.post(url)
-                else:
-                    continue
-                
-                if response.status_code in [200, 201]:
-                    print(f"✅ {method} {endpoint} - {description}")
-                    results[endpoint] = {"status": "success", "code": response.status_code}
-                else:
-                    print(f"❌ {method} {endpoint} - Status {response.status_code}")
-                    results[endpoint] = {"status": "error", "code": response.status_code}
-                    
-            except Exception as e:
-                print(f"❌ {method} {endpoint} - Error: {e}")
-                results[endpoint] = {"status": "error", "message": str(e)}
+        gathered = await asyncio.gather(
+            *[self._call(method, endpoint, description) for method, endpoint, description in endpoints]
+        )
+        results = dict(result for result in gathered if result is not None)
         
         return {"results": results}
     
-    def test_application_startup(self) -> Dict[str, Any]:
+    async def _call(self, method: str, endpoint: str, description: str) -> Optional[tuple]:
+        """Call one API endpoint, returning (endpoint, result) or None for unsupported methods"""
+        try:
+            if method == "GET":
+                response = await self.client.get(self.urls[endpoint])
+            elif method == "POST":
+                response = await self.client.post(self.urls[endpoint])
+            else:
+                return None
+            
+            if response.status_code in [200, 201]:
+                print(f"✅ {method} {endpoint} - {description}")
+                return endpoint, {"status": "success", "code": response.status_code}
+            else:
+                print(f"❌ {method} {endpoint} - Status {response.status_code}")
+                return endpoint, {"status": "error", "code": response.status_code}
+                
+        except Exception as e:
+            print(f"❌ {method} {endpoint} - Error: {e}")
+            return endpoint, {"status": "error", "message": str(e)}
+    
+    async def test_application_startup(self) -> Dict[str, Any]:
         """Test if the application started properly"""
         print("🔍 Testing application startup...")
         
         try:
             # Test root endpoint
-            response = self.session.get(self.base_url)
+            response = await self.client.get(self.urls["/"])
             
             if response.status_code == 200:
                 print("✅ Application is running and accessible")
@@ -217,36 +293,52 @@ class FastAPITester:
                     "status_code": response.status_code
                 }
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             print("❌ Application startup test timed out")
             return {"status": "error", "message": "timeout"}
         except Exception as e:
             print(f"❌ Application startup test failed: {e}")
             return {"status": "error", "message": str(e)}
     
-    def run_comprehensive_test(self, test_cors: bool = False) -> Dict[str, Any]:
+    async def warm_up_dns(self) -> None:
+        """
+        Resolve the target host once before the concurrent tests open their connections
+        
+        The lookup runs in the loop's executor, so it never blocks the event loop. A failure
+        is only reported here; the tests themselves record the connection errors.
+        """
+        url = self.urls["/"]
+        try:
+            await asyncio.get_running_loop().getaddrinfo(
+                url.host, url.port or (443 if url.scheme == "https" else 80),
+                type=socket.SOCK_STREAM
+            )
+        except (socket.gaierror, UnicodeError) as e:
+            print(f"⚠️  Could not resolve {url.host}: {e}")
+    
+    async def run_comprehensive_test(self, test_cors: bool = False) -> Dict[str, Any]:
         """Run comprehensive test suite"""
         print("🚀 Starting comprehensive FastAPI deployment test...")
         print(f"🎯 Target URL: {self.base_url}")
         print("=" * 60)
         
-        results = {}
-        
-        # Test 1: Application startup
-        results["startup"] = self.test_application_startup()
-        
-        # Test 2: OpenAPI schema
-        results["openapi"] = self.test_openapi_schema()
-        
-        # Test 3: Documentation endpoints
-        results["docs"] = self.test_fastapi_docs()
+        await self.warm_up_dns()
         
-        # Test 4: API endpoints
-        results["api_endpoints"] = self.test_api_endpoints()
-        
-        # Test 5: CORS (optional)
+        # The tests are independent, so they run concurrently:
+        # 1. application startup, 2. OpenAPI schema, 3. documentation endpoints,
+        # 4. API endpoints and 5. CORS (optional)
+        test_names = ["startup", "openapi", "docs", "api_endpoints"]
+        tests = [
+            self.test_application_startup(),
+            self.test_openapi_schema(),
+            self.test_fastapi_docs(),
+            self.test_api_endpoints()
+        ]
         if test_cors:
-            results["cors"] = self.test_cors_headers()
+            test_names.append("cors")
+            tests.append(self.test_cors_headers())
+        
+        results = dict(zip(test_names, await asyncio.gather(*tests)))
         
         # Summary
         print("\n" + "=" * 60)
@@ -270,6 +362,15 @@ class FastAPITester:
         return results
 
 
+async def run_tests(base_url: str, timeout: int, test_cors: bool = False) -> Dict[str, Any]:
+    """Run the test suite and close the HTTP client afterwards"""
+    tester = FastAPITester(base_url, timeout)
+    try:
+        return await tester.run_comprehensive_test(test_cors=test_cors)
+    finally:
+        await tester.client.aclose()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Test FastAPI deployment on Hugging Face Spaces"
@@ -299,11 +400,8 @@ def main():
         sys.exit(1)
     
     # Run tests
-    tester = FastAPITester(args.url)
-    tester.session.timeout = args.timeout
-    
     try:
-        results = tester.run_comprehensive_test(test_cors=args.test_cors)
+        results = asyncio.run(run_tests(args.url, args.timeout, test_cors=args.test_cors))
         
         # Determine exit code based on results
         success_count = sum(1 for result in results.values() 
@@ -11,16 +11,110 @@ Usage:
 """
 
 import argparse
+import asyncio
+import functools
+import importlib.util
+import io
 import json
-import requests
+import httpx
+import os
+import statistics
 import sys
 import time
-import tempfile
-import os
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Gateway errors retried (with exponential backoff) for requests that are safe to repeat
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 0.3
+
+# Statuses that count as proper handling of a request to an unknown API endpoint
+EXPECTED_ERROR_STATUSES = frozenset({404, 405, 422})
+
+# Per-test results of earlier runs, used by --fast to skip tests that passed recently
+DEFAULT_RESULTS_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "integration_tests.json")
+FAST_MODE_TTL = 3600  # seconds
+
+# Document uploaded by the file upload test, sent straight from memory
+TEST_DOC_BYTES = b"This is a test document for integration testing.\n\nIt contains some sample text to verify that file upload and processing works correctly through the Vercel proxy to the Hugging Face backend."
+
+# Latency samples taken by the performance test, and how many are in flight at once
+PERFORMANCE_SAMPLES = 10
+PERFORMANCE_WORKERS = 5
+
+# Seconds a fetched chat list may be reused while the tester has not changed any chats
+CHAT_LIST_MAX_AGE = 2.0
+
+
+def _json_loads(content: bytes):
+    """
+    Decode a JSON response body, using orjson when it is installed
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _lists_chat_id(content: bytes, chat_id) -> bool:
+    """
+    Whether a compact JSON chat list (as FastAPI renders it) contains an "id" of chat_id
+    
+    A cheap scan of the raw body; a False result is not conclusive for other JSON formatting.
+    """
+    id_field = b'"id":' + json.dumps(chat_id).encode('utf-8')
+    return id_field + b',' in content or id_field + b'}' in content
+
+
+def _find_chat(list_response: httpx.Response, chat_id) -> Optional[Dict]:
+    """The entry for chat_id in a chat list response (None if absent or the list is unreadable)"""
+    if list_response.status_code != 200:
+        return None
+    try:
+        chats = _json_loads(list_response.content)
+    except json.JSONDecodeError:
+        return None
+    for chat in chats:
+        if isinstance(chat, dict) and chat.get("id") == chat_id:
+            return chat
+    return None
+
+
+class _RetryTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport that also retries transient gateway errors
+    
+    Connection failures are retried by the base transport; a request whose pooled
+    keep-alive connection turns out to have been closed by the server is sent once
+    more. POST is never retried, so a flaky proxy cannot create duplicate chats or uploads.
+    """
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method == 'POST':
+            return await super().handle_async_request(request)
+        try:
+            response = await super().handle_async_request(request)
+        except (httpx.ReadError, httpx.RemoteProtocolError):
+            response = await super().handle_async_request(request)
+        for attempt in range(RETRY_ATTEMPTS):
+            if response.status_code not in RETRY_STATUSES:
+                break
+            await response.aclose()
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+            response = await super().handle_async_request(request)
+        return response
+
 
 @dataclass
 class TestResult:
@@ -32,179 +126,272 @@ class TestResult:
     duration: float = 0.0
 
 
+def integration_test(name: str):
+    """
+    Decorator for IntegrationTester test methods: times the test and turns any
+    exception it raises into a failed TestResult named name
+    """
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        async def wrapper(self) -> TestResult:
+            start_time = time.perf_counter()
+            try:
+                result = await test_func(self)
+            except Exception as e:
+                return TestResult(
+                    test_name=name,
+                    status=False,
+                    message=f"{name} failed: {e}",
+                    details={"error": str(e)},
+                    duration=time.perf_counter() - start_time
+                )
+            result.duration = time.perf_counter() - start_time
+            return result
+        wrapper.test_name = name
+        return wrapper
+    return decorator
+
+
 class IntegrationTester:
     """Tests frontend-backend integration"""
     
-    def __init__(self, frontend_url: str, backend_url: Optional[str] = None, verbose: bool = False):
+    # Log line prefix per level, and the levels shown without --verbose
+    _LEVEL_PREFIX = {
+        "INFO": "ℹ️",
+        "SUCCESS": "✅",
+        "FAIL": "❌",
+        "ERROR": "🚨",
+        "WARNING": "⚠️"
+    }
+    _ALWAYS_SHOWN_LEVELS = frozenset({"ERROR", "SUCCESS", "FAIL"})
+    
+    def __init__(self, frontend_url: str, backend_url: Optional[str] = None, verbose: bool = False,
+                 timeout: float = 30, cache_path: Optional[str] = None, fast: bool = False):
+        """
+        Args:
+            cache_path: JSON file recording each test's last result (None: no record kept)
+            fast: Skip independent tests that passed against this frontend within
+                  FAST_MODE_TTL according to cache_path; the chat workflow always runs
+        """
         self.frontend_url = frontend_url.rstrip('/')
         self.backend_url = backend_url.rstrip('/') if backend_url else None
         self.verbose = verbose
-        self.session = requests.Session()
-        self.session.timeout = 30
-        self.session.headers.update({
-            'User-Agent': 'RAG-AI-Agent-Integration-Tester/1.0',
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        })
+        self.cache_path = cache_path
+        self.fast = fast
+        # Endpoint URLs, resolved against the frontend once
+        self.chats_url = urljoin(self.frontend_url, "/api/chats/")
+        self.new_chat_url = self.chats_url + "new/"
+        self.upload_url = self.chats_url + "newChat/send/"
+        self.invalid_url = urljoin(self.frontend_url, "/api/invalid-endpoint-12345/")
+        # One pooled client (HTTP/2 when available) shared by the concurrently running tests.
+        # No default Content-Type: httpx sets it per request (JSON or multipart).
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={
+                'User-Agent': 'RAG-AI-Agent-Integration-Tester/1.0',
+                'Accept': 'application/json'
+            },
+            transport=_RetryTransport(
+                http2=HTTP2_AVAILABLE,
+                retries=RETRY_ATTEMPTS,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            )
+        )
         self.test_chat_id = None
+        # Last successful GET /api/chats/ as (monotonic time, response); the generation is
+        # bumped by every change the tester makes, so a list fetched before it is never cached
+        self._list_cache: Optional[Tuple[float, httpx.Response]] = None
+        self._list_generation = 0
+        # (ETag, response) of the last list that carried one; it survives invalidation because
+        # the server decides whether it is still current (304 Not Modified)
+        self._list_validator: Optional[Tuple[str, httpx.Response]] = None
         
     def log(self, message: str, level: str = "INFO"):
         """Log messages with optional verbose output"""
-        if self.verbose or level in ["ERROR", "SUCCESS", "FAIL"]:
-            prefix = {
-                "INFO": "ℹ️",
-                "SUCCESS": "✅", 
-                "FAIL": "❌",
-                "ERROR": "🚨",
-                "WARNING": "⚠️"
-            }.get(level, "📝")
-            print(f"{prefix} {message}")
+        if self.verbose or level in self._ALWAYS_SHOWN_LEVELS:
+            prefix = self._LEVEL_PREFIX.get(level, "📝")
+            sys.stdout.write(f"{prefix} {message}\n")
     
-    def _time_test(self, test_func):
-        """Decorator to time test execution"""
-        start_time = time.time()
-        result = test_func()
-        duration = time.time() - start_time
-        if hasattr(result, 'duration'):
-            result.duration = duration
-        return result
+    async def _get_chats(self, max_age: float = CHAT_LIST_MAX_AGE) -> httpx.Response:
+        """
+        GET the chat list, reusing a recent response if no chats were changed since
+        
+        Otherwise the list is revalidated with If-None-Match when an ETag is known,
+        and the earlier response is reused if the server answers 304.
+        """
+        cached = self._list_cache
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        generation = self._list_generation
+        validator = self._list_validator
+        
+        response = await self.client.get(
+            self.chats_url,
+            headers={'If-None-Match': validator[0]} if validator is not None else None
+        )
+        if response.status_code == 304 and validator is not None:
+            response = validator[1]
+        elif response.status_code == 200:
+            etag = response.headers.get('ETag')
+            if etag:
+                self._list_validator = (etag, response)
+        if response.status_code == 200 and generation == self._list_generation:
+            self._list_cache = (time.monotonic(), response)
+        return response
     
-    def test_api_proxy_basic(self) -> TestResult:
+    def _rename_url(self, chat_id) -> str:
+        """Rename endpoint URL for a chat"""
+        return f"{self.chats_url}{chat_id}/rename/"
+    
+    def _delete_url(self, chat_id) -> str:
+        """Delete endpoint URL for a chat"""
+        return f"{self.chats_url}{chat_id}/delete"
+    
+    def _invalidate_chat_list(self):
+        """Forget the cached chat list after creating, renaming or deleting a chat"""
+        self._list_cache = None
+        self._list_generation += 1
+    
+    async def _run_chat_workflow(self) -> List[TestResult]:
+        """Run the chat creation and management tests in order"""
+        return [
+            await self.test_chat_creation_workflow(),
+            await self.test_chat_management_operations()
+        ]
+    
+    @integration_test("API Proxy Basic")
+    async def test_api_proxy_basic(self) -> TestResult:
         """Test basic API proxy functionality"""
         self.log("Testing basic API proxy functionality...")
         
-        try:
-            # Test if API requests are properly proxied
-            api_url = urljoin(self.frontend_url, "/api/chats/")
-            response = self.session.get(api_url)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if isinstance(data, list):
-                        return TestResult(
-                            test_name="API Proxy Basic",
-                            status=True,
-                            message=f"API proxy working correctly, received {len(data)} chats",
-                            details={"response_type": "json", "data_type": "list", "count": len(data)}
-                        )
-                    else:
-                        return TestResult(
-                            test_name="API Proxy Basic",
-                            status=False,
-                            message="API proxy working but unexpected data format",
-                            details={"response_type": "json", "data_type": type(data).__name__}
-                        )
-                except json.JSONDecodeError:
+        # Test if API requests are properly proxied
+        response = await self._get_chats()
+        
+        if response.status_code == 200:
+            try:
+                data = _json_loads(response.content)
+                if isinstance(data, list):
+                    return TestResult(
+                        test_name="API Proxy Basic",
+                        status=True,
+                        message=f"API proxy working correctly, received {len(data)} chats",
+                        details={"response_type": "json", "data_type": "list", "count": len(data)}
+                    )
+                else:
                     return TestResult(
                         test_name="API Proxy Basic",
                         status=False,
-                        message="API proxy working but response is not JSON",
-                        details={"response_type": "non-json", "status_code": response.status_code}
+                        message="API proxy working but unexpected data format",
+                        details={"response_type": "json", "data_type": type(data).__name__}
                     )
-            else:
+            except json.JSONDecodeError:
                 return TestResult(
                     test_name="API Proxy Basic",
                     status=False,
-                    message=f"API proxy returned status {response.status_code}",
-                    details={"status_code": response.status_code}
+                    message="API proxy working but response is not JSON",
+                    details={"response_type": "non-json", "status_code": response.status_code}
                 )
-                
-        except requests.exceptions.RequestException as e:
+        else:
             return TestResult(
                 test_name="API Proxy Basic",
                 status=False,
-                message=f"API proxy connection failed: {e}",
-                details={"error": str(e)}
+                message=f"API proxy returned status {response.status_code}",
+                details={"status_code": response.status_code}
             )
     
-    def test_chat_creation_workflow(self) -> TestResult:
+    @integration_test("Chat Creation Workflow")
+    async def test_chat_creation_workflow(self) -> TestResult:
         """Test complete chat creation workflow"""
         self.log("Testing chat creation workflow...")
         
+        # Step 1: Create new chat
+        response = await self.client.post(self.new_chat_url)
+        self._invalidate_chat_list()
+        
+        if response.status_code != 200:
+            return TestResult(
+                test_name="Chat Creation Workflow",
+                status=False,
+                message=f"Chat creation failed with status {response.status_code}",
+                details={"status_code": response.status_code}
+            )
+        
         try:
-            # Step 1: Create new chat
-            create_url = urljoin(self.frontend_url, "/api/chats/new/")
-            response = self.session.post(create_url)
-            
-            if response.status_code != 200:
+            create_data = _json_loads(response.content)
+            if "chat_id" not in create_data:
                 return TestResult(
                     test_name="Chat Creation Workflow",
                     status=False,
-                    message=f"Chat creation failed with status {response.status_code}",
-                    details={"status_code": response.status_code}
+                    message="Chat creation response missing chat_id",
+                    details={"response_data": create_data}
                 )
             
-            try:
-                create_data = response.json()
-                if "chat_id" not in create_data:
-                    return TestResult(
-                        test_name="Chat Creation Workflow",
-                        status=False,
-                        message="Chat creation response missing chat_id",
-                        details={"response_data": create_data}
-                    )
-                
-                chat_id = create_data["chat_id"]
-                self.test_chat_id = chat_id  # Store for cleanup
-                
-            except json.JSONDecodeError:
+            chat_id = create_data["chat_id"]
+            self.test_chat_id = chat_id  # Store for cleanup
+            
+        except json.JSONDecodeError:
+            return TestResult(
+                test_name="Chat Creation Workflow",
+                status=False,
+                message="Chat creation returned non-JSON response"
+            )
+        
+        # Step 2: Verify chat exists in list
+        list_response = await self._get_chats()
+        
+        if list_response.status_code == 200:
+            # Fast path: find the id in the raw body, with the count from X-Total-Count
+            total_count = list_response.headers.get('X-Total-Count')
+            if total_count is not None and _lists_chat_id(list_response.content, chat_id):
                 return TestResult(
                     test_name="Chat Creation Workflow",
-                    status=False,
-                    message="Chat creation returned non-JSON response"
+                    status=True,
+                    message=f"Chat creation workflow successful (chat_id: {chat_id})",
+                    details={
+                        "chat_id": chat_id,
+                        "total_chats": int(total_count),
+                        "workflow_steps": ["create", "verify_in_list"]
+                    }
                 )
             
-            # Step 2: Verify chat exists in list
-            list_url = urljoin(self.frontend_url, "/api/chats/")
-            list_response = self.session.get(list_url)
-            
-            if list_response.status_code == 200:
-                try:
-                    chats = list_response.json()
-                    chat_ids = [chat.get("id") for chat in chats if isinstance(chat, dict)]
-                    
-                    if chat_id in chat_ids:
-                        return TestResult(
-                            test_name="Chat Creation Workflow",
-                            status=True,
-                            message=f"Chat creation workflow successful (chat_id: {chat_id})",
-                            details={
-                                "chat_id": chat_id,
-                                "total_chats": len(chats),
-                                "workflow_steps": ["create", "verify_in_list"]
-                            }
-                        )
-                    else:
-                        return TestResult(
-                            test_name="Chat Creation Workflow",
-                            status=False,
-                            message="Created chat not found in chat list",
-                            details={"chat_id": chat_id, "available_ids": chat_ids}
-                        )
-                        
-                except json.JSONDecodeError:
+            try:
+                chats = _json_loads(list_response.content)
+                chat_ids = [chat.get("id") for chat in chats if isinstance(chat, dict)]
+                
+                if chat_id in chat_ids:
+                    return TestResult(
+                        test_name="Chat Creation Workflow",
+                        status=True,
+                        message=f"Chat creation workflow successful (chat_id: {chat_id})",
+                        details={
+                            "chat_id": chat_id,
+                            "total_chats": len(chats),
+                            "workflow_steps": ["create", "verify_in_list"]
+                        }
+                    )
+                else:
                     return TestResult(
                         test_name="Chat Creation Workflow",
                         status=False,
-                        message="Chat list returned non-JSON response"
+                        message="Created chat not found in chat list",
+                        details={"chat_id": chat_id, "available_ids": chat_ids}
                     )
-            else:
+                    
+            except json.JSONDecodeError:
                 return TestResult(
                     test_name="Chat Creation Workflow",
                     status=False,
-                    message=f"Chat list retrieval failed with status {list_response.status_code}"
+                    message="Chat list returned non-JSON response"
                 )
-                
-        except Exception as e:
+        else:
             return TestResult(
                 test_name="Chat Creation Workflow",
                 status=False,
-                message=f"Chat creation workflow failed: {e}",
-                details={"error": str(e)}
+                message=f"Chat list retrieval failed with status {list_response.status_code}"
             )
     
-    def test_chat_management_operations(self) -> TestResult:
+    @integration_test("Chat Management Operations")
+    async def test_chat_management_operations(self) -> TestResult:
         """Test chat management operations (rename, delete)"""
         self.log("Testing chat management operations...")
         
@@ -215,378 +402,364 @@ class IntegrationTester:
                 message="No test chat available for management operations"
             )
         
-        try:
-            chat_id = self.test_chat_id
-            
-            # Step 1: Rename chat
-            rename_url = urljoin(self.frontend_url, f"/api/chats/{chat_id}/rename/")
-            rename_data = {"name": "Integration Test Chat"}
-            rename_response = self.session.put(rename_url, json=rename_data)
-            
-            if rename_response.status_code != 200:
-                return TestResult(
-                    test_name="Chat Management Operations",
-                    status=False,
-                    message=f"Chat rename failed with status {rename_response.status_code}",
-                    details={"operation": "rename", "status_code": rename_response.status_code}
-                )
-            
-            # Step 2: Verify rename by getting chat list
-            list_url = urljoin(self.frontend_url, "/api/chats/")
-            list_response = self.session.get(list_url)
-            
-            renamed_successfully = False
-            if list_response.status_code == 200:
-                try:
-                    chats = list_response.json()
-                    for chat in chats:
-                        if isinstance(chat, dict) and chat.get("id") == chat_id:
-                            if chat.get("name") == "Integration Test Chat":
-                                renamed_successfully = True
-                            break
-                except json.JSONDecodeError:
-                    pass
-            
-            if not renamed_successfully:
-                return TestResult(
-                    test_name="Chat Management Operations",
-                    status=False,
-                    message="Chat rename operation did not persist",
-                    details={"operation": "rename_verification"}
-                )
-            
-            # Step 3: Delete chat
-            delete_url = urljoin(self.frontend_url, f"/api/chats/{chat_id}/delete")
-            delete_response = self.session.delete(delete_url)
-            
-            if delete_response.status_code != 200:
-                return TestResult(
-                    test_name="Chat Management Operations",
-                    status=False,
-                    message=f"Chat delete failed with status {delete_response.status_code}",
-                    details={"operation": "delete", "status_code": delete_response.status_code}
-                )
-            
-            # Step 4: Verify deletion
-            list_response_after = self.session.get(list_url)
-            if list_response_after.status_code == 200:
-                try:
-                    chats_after = list_response_after.json()
-                    chat_ids_after = [chat.get("id") for chat in chats_after if isinstance(chat, dict)]
-                    
-                    if chat_id not in chat_ids_after:
-                        self.test_chat_id = None  # Clear since it's deleted
-                        return TestResult(
-                            test_name="Chat Management Operations",
-                            status=True,
-                            message="All chat management operations successful",
-                            details={
-                                "operations": ["rename", "delete"],
-                                "chat_id": chat_id,
-                                "final_verification": "chat_deleted"
-                            }
-                        )
-                    else:
-                        return TestResult(
-                            test_name="Chat Management Operations",
-                            status=False,
-                            message="Chat delete operation did not persist",
-                            details={"operation": "delete_verification"}
-                        )
-                        
-                except json.JSONDecodeError:
-                    return TestResult(
-                        test_name="Chat Management Operations",
-                        status=False,
-                        message="Could not verify chat deletion due to JSON error"
-                    )
-            
+        chat_id = self.test_chat_id
+        
+        # Step 1: Rename chat, fetching the chat list for verification at the same time
+        rename_data = {"name": "Integration Test Chat"}
+        rename_response, list_response = await asyncio.gather(
+            self.client.put(self._rename_url(chat_id), json=rename_data),
+            self._get_chats(max_age=0)
+        )
+        self._invalidate_chat_list()
+        
+        if rename_response.status_code != 200:
             return TestResult(
                 test_name="Chat Management Operations",
                 status=False,
-                message="Could not verify chat management operations"
+                message=f"Chat rename failed with status {rename_response.status_code}",
+                details={"operation": "rename", "status_code": rename_response.status_code}
             )
-            
-        except Exception as e:
+        
+        # Step 2: Verify rename; the list may have been served before the rename
+        # landed, so a list without the new name is fetched once more
+        chat = _find_chat(list_response, chat_id)
+        if chat is None or chat.get("name") != "Integration Test Chat":
+            chat = _find_chat(await self._get_chats(), chat_id)
+        renamed_successfully = chat is not None and chat.get("name") == "Integration Test Chat"
+        
+        if not renamed_successfully:
             return TestResult(
                 test_name="Chat Management Operations",
                 status=False,
-                message=f"Chat management operations failed: {e}",
-                details={"error": str(e)}
+                message="Chat rename operation did not persist",
+                details={"operation": "rename_verification"}
             )
+        
+        # Step 3: Delete chat, again fetching the list at the same time
+        delete_response, list_response_after = await asyncio.gather(
+            self.client.delete(self._delete_url(chat_id)),
+            self._get_chats(max_age=0)
+        )
+        self._invalidate_chat_list()
+        
+        if delete_response.status_code != 200:
+            return TestResult(
+                test_name="Chat Management Operations",
+                status=False,
+                message=f"Chat delete failed with status {delete_response.status_code}",
+                details={"operation": "delete", "status_code": delete_response.status_code}
+            )
+        
+        # Step 4: Verify deletion, refetching a list served before the delete landed
+        if _find_chat(list_response_after, chat_id) is not None:
+            list_response_after = await self._get_chats()
+        if list_response_after.status_code == 200:
+            try:
+                chats_after = _json_loads(list_response_after.content)
+                chat_ids_after = {chat.get("id") for chat in chats_after if isinstance(chat, dict)}
+                
+                if chat_id not in chat_ids_after:
+                    self.test_chat_id = None  # Clear since it's deleted
+                    return TestResult(
+                        test_name="Chat Management Operations",
+                        status=True,
+                        message="All chat management operations successful",
+                        details={
+                            "operations": ["rename", "delete"],
+                            "chat_id": chat_id,
+                            "final_verification": "chat_deleted"
+                        }
+                    )
+                else:
+                    return TestResult(
+                        test_name="Chat Management Operations",
+                        status=False,
+                        message="Chat delete operation did not persist",
+                        details={"operation": "delete_verification"}
+                    )
+                    
+            except json.JSONDecodeError:
+                return TestResult(
+                    test_name="Chat Management Operations",
+                    status=False,
+                    message="Could not verify chat deletion due to JSON error"
+                )
+        
+        return TestResult(
+            test_name="Chat Management Operations",
+            status=False,
+            message="Could not verify chat management operations"
+        )
     
-    def test_file_upload_endpoint(self) -> TestResult:
+    @integration_test("File Upload Endpoint")
+    async def test_file_upload_endpoint(self) -> TestResult:
         """Test file upload functionality through proxy"""
         self.log("Testing file upload endpoint...")
         
-        try:
-            # Create a temporary test file
-            test_content = "This is a test document for integration testing.\n\nIt contains some sample text to verify that file upload and processing works correctly through the Vercel proxy to the Hugging Face backend."
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as temp_file:
-                temp_file.write(test_content)
-                temp_file_path = temp_file.name
-            
+        # Test file upload
+        files = {'file': ('test_document.txt', io.BytesIO(TEST_DOC_BYTES), 'text/plain')}
+        data = {
+            'query': 'What is this document about?',
+            'agent': 'false'
+        }
+        
+        response = await self.client.post(
+            self.upload_url,
+            files=files,
+            data=data,
+            timeout=60  # Longer timeout for file processing
+        )
+        # Sending to "newChat" creates a chat
+        self._invalidate_chat_list()
+        
+        if response.status_code == 200:
             try:
-                # Test file upload
-                upload_url = urljoin(self.frontend_url, "/api/chats/newChat/send/")
-                
-                with open(temp_file_path, 'rb') as f:
-                    files = {'file': ('test_document.txt', f, 'text/plain')}
-                    data = {
-                        'query': 'What is this document about?',
-                        'agent': 'false'
-                    }
-                    
-                    # Remove JSON content-type header for multipart upload
-                    headers = self.session.headers.copy()
-                    if 'Content-Type' in headers:
-                        del headers['Content-Type']
-                    
-                    response = self.session.post(
-                        upload_url,
-                        files=files,
-                        data=data,
-                        headers=headers,
-                        timeout=60  # Longer timeout for file processing
+                response_data = _json_loads(response.content)
+                if "response" in response_data:
+                    return TestResult(
+                        test_name="File Upload Endpoint",
+                        status=True,
+                        message="File upload and processing successful",
+                        details={
+                            "file_size": len(TEST_DOC_BYTES),
+                            "response_received": True,
+                            "response_length": len(response_data.get("response", ""))
+                        }
                     )
-                
-                if response.status_code == 200:
-                    try:
-                        response_data = response.json()
-                        if "response" in response_data:
-                            return TestResult(
-                                test_name="File Upload Endpoint",
-                                status=True,
-                                message="File upload and processing successful",
-                                details={
-                                    "file_size": len(test_content),
-                                    "response_received": True,
-                                    "response_length": len(response_data.get("response", ""))
-                                }
-                            )
-                        else:
-                            return TestResult(
-                                test_name="File Upload Endpoint",
-                                status=False,
-                                message="File upload succeeded but no response received",
-                                details={"response_data": response_data}
-                            )
-                    except json.JSONDecodeError:
-                        return TestResult(
-                            test_name="File Upload Endpoint",
-                            status=False,
-                            message="File upload succeeded but response is not JSON"
-                        )
                 else:
                     return TestResult(
                         test_name="File Upload Endpoint",
                         status=False,
-                        message=f"File upload failed with status {response.status_code}",
-                        details={"status_code": response.status_code}
+                        message="File upload succeeded but no response received",
+                        details={"response_data": response_data}
                     )
-                    
-            finally:
-                # Cleanup temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
-                    
-        except Exception as e:
+            except json.JSONDecodeError:
+                return TestResult(
+                    test_name="File Upload Endpoint",
+                    status=False,
+                    message="File upload succeeded but response is not JSON"
+                )
+        else:
             return TestResult(
                 test_name="File Upload Endpoint",
                 status=False,
-                message=f"File upload test failed: {e}",
-                details={"error": str(e)}
+                message=f"File upload failed with status {response.status_code}",
+                details={"status_code": response.status_code}
             )
     
-    def test_cors_and_headers(self) -> TestResult:
+    @integration_test("CORS and Headers")
+    async def test_cors_and_headers(self) -> TestResult:
         """Test CORS configuration and headers"""
         self.log("Testing CORS configuration and headers...")
         
-        try:
-            # Test preflight request
-            api_url = urljoin(self.frontend_url, "/api/chats/")
-            
-            preflight_headers = {
-                'Origin': self.frontend_url,
-                'Access-Control-Request-Method': 'POST',
-                'Access-Control-Request-Headers': 'Content-Type, Authorization'
-            }
-            
-            preflight_response = self.session.options(api_url, headers=preflight_headers)
-            
-            # Test actual request
-            actual_headers = {
-                'Origin': self.frontend_url,
-                'Content-Type': 'application/json'
-            }
-            
-            actual_response = self.session.get(api_url, headers=actual_headers)
-            
-            # Analyze CORS headers
-            cors_headers = {
-                'Access-Control-Allow-Origin': actual_response.headers.get('Access-Control-Allow-Origin'),
-                'Access-Control-Allow-Methods': actual_response.headers.get('Access-Control-Allow-Methods'),
-                'Access-Control-Allow-Headers': actual_response.headers.get('Access-Control-Allow-Headers'),
-                'Access-Control-Allow-Credentials': actual_response.headers.get('Access-Control-Allow-Credentials')
-            }
-            
-            # Check if CORS is properly configured
-            has_cors = any(cors_headers.values())
-            origin_allowed = (
-                cors_headers['Access-Control-Allow-Origin'] == '*' or
-                cors_headers['Access-Control-Allow-Origin'] == self.frontend_url
+        # Test preflight request
+        api_url = self.chats_url
+        
+        preflight_headers = {
+            'Origin': self.frontend_url,
+            'Access-Control-Request-Method': 'POST',
+            'Access-Control-Request-Headers': 'Content-Type, Authorization'
+        }
+        
+        preflight_response = await self.client.options(api_url, headers=preflight_headers)
+        
+        # Test actual request
+        actual_headers = {
+            'Origin': self.frontend_url,
+            'Content-Type': 'application/json'
+        }
+        
+        actual_response = await self.client.get(api_url, headers=actual_headers)
+        
+        # Analyze CORS headers
+        cors_headers = {
+            'Access-Control-Allow-Origin': actual_response.headers.get('Access-Control-Allow-Origin'),
+            'Access-Control-Allow-Methods': actual_response.headers.get('Access-Control-Allow-Methods'),
+            'Access-Control-Allow-Headers': actual_response.headers.get('Access-Control-Allow-Headers'),
+            'Access-Control-Allow-Credentials': actual_response.headers.get('Access-Control-Allow-Credentials')
+        }
+        
+        # Check if CORS is properly configured
+        has_cors = any(cors_headers.values())
+        origin_allowed = (
+            cors_headers['Access-Control-Allow-Origin'] == '*' or
+            cors_headers['Access-Control-Allow-Origin'] == self.frontend_url
+        )
+        
+        if actual_response.status_code == 200 and (has_cors or not self.backend_url):
+            return TestResult(
+                test_name="CORS and Headers",
+                status=True,
+                message="CORS configuration working correctly",
+                details={
+                    "preflight_status": preflight_response.status_code,
+                    "actual_status": actual_response.status_code,
+                    "cors_headers": {k: v for k, v in cors_headers.items() if v},
+                    "origin_allowed": origin_allowed
+                }
             )
-            
-            if actual_response.status_code == 200 and (has_cors or not self.backend_url):
-                return TestResult(
-                    test_name="CORS and Headers",
-                    status=True,
-                    message="CORS configuration working correctly",
-                    details={
-                        "preflight_status": preflight_response.status_code,
-                        "actual_status": actual_response.status_code,
-                        "cors_headers": {k: v for k, v in cors_headers.items() if v},
-                        "origin_allowed": origin_allowed
-                    }
-                )
-            else:
-                return TestResult(
-                    test_name="CORS and Headers",
-                    status=False,
-                    message="CORS configuration may have issues",
-                    details={
-                        "preflight_status": preflight_response.status_code,
-                        "actual_status": actual_response.status_code,
-                        "cors_headers": cors_headers
-                    }
-                )
-                
-        except Exception as e:
+        else:
             return TestResult(
                 test_name="CORS and Headers",
                 status=False,
-                message=f"CORS test failed: {e}",
-                details={"error": str(e)}
+                message="CORS configuration may have issues",
+                details={
+                    "preflight_status": preflight_response.status_code,
+                    "actual_status": actual_response.status_code,
+                    "cors_headers": cors_headers
+                }
             )
     
-    def test_error_handling(self) -> TestResult:
+    @integration_test("Error Handling")
+    async def test_error_handling(self) -> TestResult:
         """Test error handling in API proxy"""
         self.log("Testing error handling...")
         
-        try:
-            # Test with invalid endpoint
-            invalid_url = urljoin(self.frontend_url, "/api/invalid-endpoint-12345/")
-            response = self.session.get(invalid_url)
-            
-            # We expect either 404 from backend or proper error handling
-            if response.status_code in [404, 405, 422]:
-                try:
-                    error_data = response.json()
-                    return TestResult(
-                        test_name="Error Handling",
-                        status=True,
-                        message=f"Error handling working correctly (status: {response.status_code})",
-                        details={
-                            "status_code": response.status_code,
-                            "error_format": "json",
-                            "error_data": error_data
-                        }
-                    )
-                except json.JSONDecodeError:
-                    return TestResult(
-                        test_name="Error Handling",
-                        status=True,
-                        message=f"Error handling working (status: {response.status_code}, non-JSON response)",
-                        details={"status_code": response.status_code, "error_format": "non-json"}
-                    )
-            else:
+        # Test with invalid endpoint
+        response = await self.client.get(self.invalid_url)
+        
+        # We expect either 404 from backend or proper error handling
+        if response.status_code in EXPECTED_ERROR_STATUSES:
+            try:
+                error_data = _json_loads(response.content)
                 return TestResult(
                     test_name="Error Handling",
-                    status=False,
-                    message=f"Unexpected error response status: {response.status_code}",
-                    details={"status_code": response.status_code}
+                    status=True,
+                    message=f"Error handling working correctly (status: {response.status_code})",
+                    details={
+                        "status_code": response.status_code,
+                        "error_format": "json",
+                        "error_data": error_data
+                    }
                 )
-                
-        except Exception as e:
+            except json.JSONDecodeError:
+                return TestResult(
+                    test_name="Error Handling",
+                    status=True,
+                    message=f"Error handling working (status: {response.status_code}, non-JSON response)",
+                    details={"status_code": response.status_code, "error_format": "non-json"}
+                )
+        else:
             return TestResult(
                 test_name="Error Handling",
                 status=False,
-                message=f"Error handling test failed: {e}",
-                details={"error": str(e)}
+                message=f"Unexpected error response status: {response.status_code}",
+                details={"status_code": response.status_code}
             )
     
-    def test_performance_metrics(self) -> TestResult:
+    @integration_test("Performance Metrics")
+    async def test_performance_metrics(self) -> TestResult:
         """Test basic performance metrics"""
         self.log("Testing performance metrics...")
         
-        try:
-            # Test multiple requests to measure consistency
-            api_url = urljoin(self.frontend_url, "/api/chats/")
-            response_times = []
-            
-            for i in range(3):
-                start_time = time.time()
-                response = self.session.get(api_url)
-                end_time = time.time()
-                
-                if response.status_code == 200:
-                    response_times.append(end_time - start_time)
-                else:
-                    return TestResult(
-                        test_name="Performance Metrics",
-                        status=False,
-                        message=f"Performance test failed - request {i+1} returned status {response.status_code}"
-                    )
-            
-            if response_times:
-                avg_response_time = sum(response_times) / len(response_times)
-                max_response_time = max(response_times)
-                min_response_time = min(response_times)
-                
-                # Consider good performance if average response time is under 5 seconds
-                performance_good = avg_response_time < 5.0
-                
-                return TestResult(
-                    test_name="Performance Metrics",
-                    status=performance_good,
-                    message=f"Performance test completed (avg: {avg_response_time:.2f}s)",
-                    details={
-                        "average_response_time": round(avg_response_time, 3),
-                        "max_response_time": round(max_response_time, 3),
-                        "min_response_time": round(min_response_time, 3),
-                        "requests_tested": len(response_times),
-                        "performance_threshold": 5.0
-                    }
-                )
+        # Sample the list endpoint with several concurrent requests
+        api_url = self.chats_url
+        semaphore = asyncio.Semaphore(PERFORMANCE_WORKERS)
+        # A throwaway request absorbs any serverless cold start; it is reported on its own
+        _, cold_start_time = await self._timed_get(api_url, semaphore)
+        samples = await asyncio.gather(*[
+            self._timed_get(api_url, semaphore) for _ in range(PERFORMANCE_SAMPLES)
+        ])
+        
+        response_times = []
+        for i, (status_code, elapsed) in enumerate(samples):
+            if status_code == 200:
+                response_times.append(elapsed)
             else:
                 return TestResult(
                     test_name="Performance Metrics",
                     status=False,
-                    message="No successful requests for performance measurement"
+                    message=f"Performance test failed - request {i+1} returned status {status_code}"
                 )
-                
-        except Exception as e:
+        
+        if response_times:
+            avg_response_time = sum(response_times) / len(response_times)
+            max_response_time = max(response_times)
+            min_response_time = min(response_times)
+            p50_response_time = statistics.median(response_times)
+            # Inclusive quantiles stay within the observed range
+            p95_response_time = (statistics.quantiles(response_times, n=20, method='inclusive')[18]
+                                 if len(response_times) > 1 else response_times[0])
+            
+            # Consider good performance if average response time is under 5 seconds
+            performance_good = avg_response_time < 5.0
+            
+            return TestResult(
+                test_name="Performance Metrics",
+                status=performance_good,
+                message=f"Performance test completed (avg: {avg_response_time:.2f}s)",
+                details={
+                    "average_response_time": round(avg_response_time, 3),
+                    "max_response_time": round(max_response_time, 3),
+                    "min_response_time": round(min_response_time, 3),
+                    "p50_response_time": round(p50_response_time, 3),
+                    "p95_response_time": round(p95_response_time, 3),
+                    "requests_tested": len(response_times),
+                    "cold_start_ms": round(cold_start_time * 1000, 1),
+                    "performance_threshold": 5.0
+                }
+            )
+        else:
             return TestResult(
                 test_name="Performance Metrics",
                 status=False,
-                message=f"Performance test failed: {e}",
-                details={"error": str(e)}
+                message="No successful requests for performance measurement"
             )
     
-    def cleanup(self):
+    async def _timed_get(self, url: str, semaphore: asyncio.Semaphore) -> Tuple[int, float]:
+        """GET a URL once the semaphore allows, returning the status code and elapsed seconds"""
+        async with semaphore:
+            start_time = time.perf_counter()
+            response = await self.client.get(url)
+            return response.status_code, time.perf_counter() - start_time
+    
+    async def warm_up(self):
+        """Hit the frontend once so TLS setup and cold starts do not land in a test's timings"""
+        try:
+            await self.client.head(self.frontend_url)
+        except httpx.HTTPError as e:
+            self.log(f"Warm-up request failed: {e}", "WARNING")
+    
+    async def cleanup(self):
         """Clean up any test resources"""
         if self.test_chat_id:
             try:
-                delete_url = urljoin(self.frontend_url, f"/api/chats/{self.test_chat_id}/delete")
-                self.session.delete(delete_url)
+                await self.client.delete(self._delete_url(self.test_chat_id))
                 self.log("Cleaned up test chat", "INFO")
             except:
                 pass  # Ignore cleanup errors
     
-    def run_all_tests(self) -> List[TestResult]:
+    def _load_results_cache(self) -> Dict[str, Dict]:
+        """Earlier test results by test method name (empty if there is no readable cache)"""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _save_results_cache(self, cache: Dict[str, Dict]):
+        """Write the results cache atomically (a temp file moved into place)"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            self.log(f"Could not save test results cache: {e}", "WARNING")
+    
+    def _recently_passed(self, cache: Dict[str, Dict], test_name: str, now: float) -> bool:
+        """Whether the cache shows a pass of this test against this frontend within FAST_MODE_TTL"""
+        entry = cache.get(test_name)
+        return (
+            isinstance(entry, dict)
+            and entry.get("status") is True
+            and entry.get("frontend") == self.frontend_url
+            and now - entry.get("ts", 0) < FAST_MODE_TTL
+        )
+    
+    async def run_all_tests(self) -> List[TestResult]:
         """Run all integration tests"""
         self.log("Starting frontend-backend integration testing...", "INFO")
         self.log(f"Frontend URL: {self.frontend_url}", "INFO")
@@ -603,13 +776,49 @@ class IntegrationTester:
             # File upload test last as it's most resource intensive
             self.test_file_upload_endpoint,
         ]
+        # Management operations work on the chat created by the creation workflow, so that
+        # pair runs in order; every other test runs concurrently alongside it
+        chained_tests = [self.test_chat_creation_workflow, self.test_chat_management_operations]
+        independent_tests = [test_func for test_func in tests if test_func not in chained_tests]
+        
+        cache = self._load_results_cache() if self.cache_path else {}
+        test_results = {}
+        if self.fast:
+            now = time.time()
+            for test_func in independent_tests:
+                if self._recently_passed(cache, test_func.__name__, now):
+                    test_results[test_func] = TestResult(
+                        test_name=test_func.test_name,
+                        status=True,
+                        message="Skipped (--fast): passed recently against this frontend"
+                    )
+            independent_tests = [test_func for test_func in independent_tests if test_func not in test_results]
         
         results = []
         
         try:
+            await self.warm_up()
+            chain_results, *independent_results = await asyncio.gather(
+                self._run_chat_workflow(),
+                *[test_func() for test_func in independent_tests]
+            )
+            test_results.update(zip(chained_tests, chain_results))
+            test_results.update(zip(independent_tests, independent_results))
+            
+            if self.cache_path:
+                now = time.time()
+                for test_func in chained_tests + independent_tests:
+                    cache[test_func.__name__] = {
+                        "ts": now,
+                        "frontend": self.frontend_url,
+                        "status": test_results[test_func].status
+                    }
+                self._save_results_cache(cache)
+            
+            # Report in the declared test order
             for test_func in tests:
                 self.log(f"\n--- {test_func.__name__.replace('test_', '').replace('_', ' ').title()} ---")
-                result = self._time_test(test_func)
+                result = test_results[test_func]
                 results.append(result)
                 
                 if result.status:
@@ -626,7 +835,9 @@ class IntegrationTester:
         
         finally:
             # Always cleanup
-            self.cleanup()
+            await self.cleanup()
+            await self.client.aclose()
+            sys.stdout.flush()
         
         return results
 
@@ -655,6 +866,16 @@ def main():
         default=30,
         help="Request timeout in seconds (default: 30)"
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Skip tests that passed against this frontend within the last hour"
+    )
+    parser.add_argument(
+        "--cache-path",
+        default=DEFAULT_RESULTS_CACHE,
+        help=f"Test results cache used by --fast (default: {DEFAULT_RESULTS_CACHE})"
+    )
     
     args = parser.parse_args()
     
@@ -668,11 +889,11 @@ def main():
         sys.exit(1)
     
     # Run integration tests
-    tester = IntegrationTester(args.frontend, args.backend, args.verbose)
-    tester.session.timeout = args.timeout
+    tester = IntegrationTester(args.frontend, args.backend, args.verbose, timeout=args.timeout,
+                               cache_path=args.cache_path, fast=args.fast)
     
     try:
-        results = tester.run_all_tests()
+        results = asyncio.run(tester.run_all_tests())
         
         # Summary
         print(f"\n{'='*70}")
@@ -11,17 +11,37 @@ Usage:
 
 Requirements:
     - Internet connection
-    - Python requests library
+    - Python aiohttp library (aiodns optional, for c-ares DNS lookups)
 """
 
+import asyncio
+import contextvars
 import socket
-import requests
+import struct
+import aiohttp
 import time
 import argparse
 import sys
 from urllib.parse import urlparse
 from typing import Dict, List, Tuple, Optional
 
+# Lookup failures reported as DNS errors (aiodns raises its own error type)
+try:
+    import aiodns
+    DNS_ERRORS = (socket.gaierror, aiodns.error.DNSError)
+except ImportError:
+    aiodns = None
+    DNS_ERRORS = (socket.gaierror,)
+
+# Redirects an HTTP probe may follow before it counts as failed
+MAX_REDIRECTS = 3
+
+# Log lines held back for the service being tested, so services tested
+# concurrently still print one block each (None means print straight away)
+_service_output: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "service_output", default=None
+)
+
 # Color codes for terminal output
 class Colors:
     GREEN = '\033[92m'
@@ -31,33 +51,99 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+class PlainColors(Colors):
+    """Empty color codes for output that is not a terminal."""
+    GREEN = RED = YELLOW = BLUE = BOLD = END = ''
+
+class CachedResolver(aiohttp.abc.AbstractResolver):
+    """aiohttp resolver that reuses the tester's own DNS results for HTTP requests."""
+    
+    def __init__(self, dns_cache: Dict[str, str]):
+        self.dns_cache = dns_cache
+        self.fallback = aiohttp.DefaultResolver()
+    
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> List[Dict]:
+        ip = self.dns_cache.get(host)
+        if ip is None or family == socket.AF_INET6:
+            return await self.fallback.resolve(host, port, family)
+        # The URL still carries the hostname, so the Host header and TLS SNI are unchanged
+        return [{
+            "hostname": host,
+            "host": ip,
+            "port": port,
+            "family": socket.AF_INET,
+            "proto": 0,
+            "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV
+        }]
+    
+    async def close(self):
+        await self.fallback.close()
+
 class NetworkTester:
     """Network connectivity testing class."""
     
+    # Color attribute and symbol per log level (unknown levels are printed plain)
+    _LEVELS = {
+        "SUCCESS": ("GREEN", "✅ "),
+        "ERROR": ("RED", "❌ "),
+        "WARNING": ("YELLOW", "⚠️  "),
+        "INFO": ("BLUE", "ℹ️  ")
+    }
+    
     def __init__(self, timeout: int = 10, verbose: bool = False):
         self.timeout = timeout
         self.verbose = verbose
         self.results = []
+        self.colors = Colors if sys.stdout.isatty() else PlainColors
+        self._dns_cache: Dict[str, str] = {}
+        self._dns_lookups: Dict[str, asyncio.Future] = {}
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._resolver = None
+    
+    def _emit(self, line: str):
+        """Print a line, or hold it back while a service is tested concurrently."""
+        output = _service_output.get()
+        if output is not None:
+            output.append(line)
+        else:
+            print(line)
     
     def log(self, message: str, level: str = "INFO"):
-        """Log a message with color coding."""
-        if level == "SUCCESS":
-            print(f"{Colors.GREEN}✅ {message}{Colors.END}")
-        elif level == "ERROR":
-            print(f"{Colors.RED}❌ {message}{Colors.END}")
-        elif level == "WARNING":
-            print(f"{Colors.YELLOW}⚠️  {message}{Colors.END}")
-        elif level == "INFO":
-            print(f"{Colors.BLUE}ℹ️  {message}{Colors.END}")
+        """Log a message with color coding (when writing to a terminal)."""
+        color, symbol = self._LEVELS.get(level, (None, ""))
+        if color is None:
+            self._emit(message)
         else:
-            print(message)
+            c = self.colors
+            self._emit(f"{getattr(c, color)}{symbol}{message}{c.END}")
+    
+    async def _resolve(self, hostname: str) -> str:
+        """Resolve hostname to an IPv4 address, with c-ares when aiodns is installed."""
+        if self._resolver is not None:
+            result = await self._resolver.getaddrinfo(hostname, family=socket.AF_INET)
+            return result.nodes[0].addr[0].decode()
+        loop = asyncio.get_running_loop()
+        addresses = await loop.getaddrinfo(hostname, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+        return addresses[0][4][0]
+    
+    async def _timed_resolve(self, hostname: str) -> Tuple[str, float]:
+        """Resolve hostname within the timeout, returning the address and seconds taken."""
+        start_time = time.time()
+        ip = await asyncio.wait_for(self._resolve(hostname), self.timeout)
+        return ip, time.time() - start_time
     
-    def test_dns_resolution(self, hostname: str) -> Tuple[bool, Optional[str], Optional[str]]:
-        """Test DNS resolution for a hostname."""
+    def _resolve_all(self, hostnames: List[str]):
+        """Start DNS lookups for all hostnames at once; each host is looked up once per run."""
+        for hostname in hostnames:
+            if hostname not in self._dns_lookups:
+                self._dns_lookups[hostname] = asyncio.ensure_future(self._timed_resolve(hostname))
+    
+    async def test_dns_resolution(self, hostname: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Test DNS resolution for a hostname, using the lookup started by _resolve_all."""
         try:
-            start_time = time.time()
-            ip = socket.gethostbyname(hostname)
-            resolution_time = time.time() - start_time
+            self._resolve_all([hostname])
+            ip, resolution_time = await self._dns_lookups[hostname]
+            self._dns_cache[hostname] = ip
             
             if self.verbose:
                 self.log(f"DNS resolution for {hostname}: {ip} ({resolution_time:.3f}s)", "SUCCESS")
@@ -65,7 +151,11 @@ class NetworkTester:
                 self.log(f"DNS resolution for {hostname}: {ip}", "SUCCESS")
             
             return True, ip, None
-        except socket.gaierror as e:
+        except asyncio.TimeoutError:
+            error_msg = f"DNS resolution timeout for {hostname} (>{self.timeout}s)"
+            self.log(error_msg, "ERROR")
+            return False, None, error_msg
+        except DNS_ERRORS as e:
             error_msg = f"DNS resolution failed for {hostname}: {str(e)}"
             self.log(error_msg, "ERROR")
             return False, None, error_msg
@@ -74,72 +164,77 @@ class NetworkTester:
             self.log(error_msg, "ERROR")
             return False, None, error_msg
     
-    def test_port_connectivity(self, hostname: str, port: int, ip: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+    async def test_port_connectivity(self, hostname: str, port: int, ip: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """Test TCP connectivity to a specific port."""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            
             start_time = time.time()
-            result = sock.connect_ex((hostname, port))
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip or hostname, port), self.timeout)
             connect_time = time.time() - start_time
-            sock.close()
+            # Linger 0: close with a reset, so repeated runs do not pile up sockets in TIME_WAIT
+            writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+            writer.close()
+            await writer.wait_closed()
             
-            if result == 0:
-                if self.verbose:
-                    self.log(f"Port {port} is open on {hostname} ({connect_time:.3f}s)", "SUCCESS")
-                else:
-                    self.log(f"Port {port} is open on {hostname}", "SUCCESS")
-                return True, None
+            if self.verbose:
+                self.log(f"Port {port} is open on {hostname} ({connect_time:.3f}s)", "SUCCESS")
             else:
-                error_msg = f"Port {port} is closed on {hostname}"
-                self.log(error_msg, "ERROR")
-                return False, error_msg
+                self.log(f"Port {port} is open on {hostname}", "SUCCESS")
+            return True, None
                 
-        except socket.timeout:
+        except asyncio.TimeoutError:
             error_msg = f"Port {port} connection timeout on {hostname}"
             self.log(error_msg, "ERROR")
             return False, error_msg
+        except OSError:
+            error_msg = f"Port {port} is closed on {hostname}"
+            self.log(error_msg, "ERROR")
+            return False, error_msg
         except Exception as e:
             error_msg = f"Port {port} connection error on {hostname}: {str(e)}"
             self.log(error_msg, "ERROR")
             return False, error_msg
     
-    def test_http_connectivity(self, url: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
+    async def test_http_connectivity(self, url: str) -> Tuple[bool, Optional[Dict], Optional[str]]:
         """Test HTTP/HTTPS connectivity and response."""
         try:
             start_time = time.time()
-            response = requests.get(url, timeout=self.timeout, allow_redirects=True)
+            # Only the status is needed, so HEAD avoids downloading the page; servers
+            # that reject HEAD get a GET that is closed before its body is read
+            response = await self.session.head(url, allow_redirects=True, max_redirects=MAX_REDIRECTS)
+            response.release()
+            if response.status in (405, 501):
+                response = await self.session.get(url, allow_redirects=True, max_redirects=MAX_REDIRECTS)
+                response.close()
             response_time = time.time() - start_time
             
             response_info = {
-                "status_code": response.status_code,
+                "status_code": response.status,
                 "response_time": response_time,
                 "headers": dict(response.headers),
-                "url": response.url,
-                "redirected": response.url != url
+                "url": str(response.url),
+                "redirected": str(response.url) != url
             }
             
-            if response.status_code == 200:
+            if response.status == 200:
                 if self.verbose:
-                    self.log(f"HTTP {response.status_code} from {url} ({response_time:.3f}s)", "SUCCESS")
+                    self.log(f"HTTP {response.status} from {url} ({response_time:.3f}s)", "SUCCESS")
                 else:
-                    self.log(f"HTTP {response.status_code} from {url}", "SUCCESS")
+                    self.log(f"HTTP {response.status} from {url}", "SUCCESS")
                 return True, response_info, None
             else:
-                error_msg = f"HTTP {response.status_code} from {url}"
+                error_msg = f"HTTP {response.status} from {url}"
                 self.log(error_msg, "WARNING")
                 return False, response_info, error_msg
                 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             error_msg = f"HTTP timeout for {url} (>{self.timeout}s)"
             self.log(error_msg, "ERROR")
             return False, None, error_msg
-        except requests.exceptions.ConnectionError as e:
+        except aiohttp.ClientConnectionError as e:
             error_msg = f"HTTP connection error for {url}: {str(e)}"
             self.log(error_msg, "ERROR")
             return False, None, error_msg
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             error_msg = f"HTTP request error for {url}: {str(e)}"
             self.log(error_msg, "ERROR")
             return False, None, error_msg
@@ -148,9 +243,10 @@ class NetworkTester:
             self.log(error_msg, "ERROR")
             return False, None, error_msg
     
-    def test_service_connectivity(self, service_name: str, hostname: str, port: int, https_url: Optional[str] = None):
-        """Test complete connectivity for a service."""
-        print(f"\n{Colors.BOLD}🔍 Testing {service_name} ({hostname}:{port}){Colors.END}")
+    async def test_service_connectivity(self, service_name: str, hostname: str, port: int, https_url: Optional[str] = None) -> Dict:
+        """Test complete connectivity for a service, returning its result for the caller to record."""
+        c = self.colors
+        self._emit(f"\n{c.BOLD}🔍 Testing {service_name} ({hostname}:{port}){c.END}")
         
         service_result = {
             "service": service_name,
@@ -164,32 +260,32 @@ class NetworkTester:
         }
         
         # Test DNS resolution
-        dns_success, ip, dns_error = self.test_dns_resolution(hostname)
+        dns_success, ip, dns_error = await self.test_dns_resolution(hostname)
         service_result["dns_success"] = dns_success
         service_result["ip_address"] = ip
         if dns_error:
             service_result["errors"].append(dns_error)
         
+        # Test HTTP connectivity (if URL provided and DNS succeeded). The HTTP request opens
+        # the port itself, so any response, even an error status, also passes the port test
+        # and no separate TCP probe is made
+        if https_url and dns_success:
+            http_success, http_info, http_error = await self.test_http_connectivity(https_url)
+            service_result["port_success"] = http_info is not None
+            service_result["http_success"] = http_success
+            service_result["http_info"] = http_info
+            if http_error:
+                service_result["errors"].append(http_error)
         # Test port connectivity (only if DNS succeeded)
-        if dns_success:
-            port_success, port_error = self.test_port_connectivity(hostname, port, ip)
+        elif dns_success:
+            port_success, port_error = await self.test_port_connectivity(hostname, port, ip)
             service_result["port_success"] = port_success
             if port_error:
                 service_result["errors"].append(port_error)
         else:
             self.log(f"Skipping port test for {hostname} (DNS failed)", "WARNING")
-        
-        # Test HTTP connectivity (if URL provided and port is accessible)
-        if https_url and dns_success and service_result.get("port_success", False):
-            http_success, http_info, http_error = self.test_http_connectivity(https_url)
-            service_result["http_success"] = http_success
-            service_result["http_info"] = http_info
-            if http_error:
-                service_result["errors"].append(http_error)
-        elif https_url:
-            self.log(f"Skipping HTTP test for {https_url} (connectivity issues)", "WARNING")
-        
-        self.results.append(service_result)
+            if https_url:
+                self.log(f"Skipping HTTP test for {https_url} (connectivity issues)", "WARNING")
         
         # Summary for this service
         total_tests = 2 + (1 if https_url else 0)
@@ -203,11 +299,23 @@ class NetworkTester:
             self.log(f"{service_name}: All tests passed ✨", "SUCCESS")
         else:
             self.log(f"{service_name}: {passed_tests}/{total_tests} tests passed", "WARNING")
+        
+        return service_result
+    
+    async def _run_buffered(self, coro) -> Tuple[List[str], object]:
+        """Await a test, collecting its log lines instead of printing them."""
+        output = []
+        # Runs in its own task under asyncio.gather, so this only affects this test
+        _service_output.set(output)
+        return output, await coro
     
-    def test_all_services(self):
+    async def test_all_services(self):
         """Test all external services used by RAG AI-Agent."""
-        print(f"{Colors.BOLD}{Colors.BLUE}🌐 RAG AI-Agent Network Connectivity Tests{Colors.END}")
-        print(f"{Colors.BOLD}{'='*60}{Colors.END}")
+        c = self.colors
+        sys.stdout.write(
+            f"{c.BOLD}{c.BLUE}🌐 RAG AI-Agent Network Connectivity Tests{c.END}\n"
+            f"{c.BOLD}{'='*60}{c.END}\n"
+        )
         
         # Define all services to test
         services = [
@@ -249,21 +357,30 @@ class NetworkTester:
             }
         ]
         
-        # Test each service
-        for service in services:
-            self.test_service_connectivity(
+        # Resolve every hostname in one batch before any connections are made
+        self._resolve_all([service["hostname"] for service in services])
+        
+        # Test all services concurrently, then print and record them in the order above
+        outcomes = await asyncio.gather(*[
+            self._run_buffered(self.test_service_connectivity(
                 service["name"],
                 service["hostname"],
                 service["port"],
                 service.get("https_url")
-            )
+            ))
+            for service in services
+        ])
+        for output, service_result in outcomes:
+            sys.stdout.write("\n".join(output) + "\n")
+            self.results.append(service_result)
         
         # Generate summary
         self.generate_summary()
     
-    def test_custom_backend(self, backend_url: str):
+    async def test_custom_backend(self, backend_url: str):
         """Test connectivity to a custom backend URL."""
-        print(f"\n{Colors.BOLD}🔍 Testing Custom Backend{Colors.END}")
+        c = self.colors
+        print(f"\n{c.BOLD}🔍 Testing Custom Backend{c.END}")
         
         try:
             parsed_url = urlparse(backend_url)
@@ -274,34 +391,75 @@ class NetworkTester:
                 self.log(f"Invalid backend URL: {backend_url}", "ERROR")
                 return
             
-            self.test_service_connectivity(
+            service_result = await self.test_service_connectivity(
                 f"Custom Backend ({backend_url})",
                 hostname,
                 port,
                 backend_url
             )
+            self.results.append(service_result)
             
-            # Test specific endpoints
+            # Test specific endpoints concurrently, printing them in the order listed
             endpoints = ["/health", "/docs", "/api/health"]
-            for endpoint in endpoints:
-                test_url = f"{backend_url.rstrip('/')}{endpoint}"
-                print(f"\n  Testing endpoint: {endpoint}")
-                success, info, error = self.test_http_connectivity(test_url)
-                
-                if success and info:
-                    self.log(f"Endpoint {endpoint}: HTTP {info['status_code']}", "SUCCESS")
-                elif info and info.get('status_code'):
-                    self.log(f"Endpoint {endpoint}: HTTP {info['status_code']}", "WARNING")
-                else:
-                    self.log(f"Endpoint {endpoint}: Failed", "ERROR")
+            outcomes = await asyncio.gather(*[
+                self._run_buffered(self._test_backend_endpoint(backend_url, endpoint))
+                for endpoint in endpoints
+            ])
+            for output, _ in outcomes:
+                sys.stdout.write("\n".join(output) + "\n")
         
         except Exception as e:
             self.log(f"Error testing backend {backend_url}: {str(e)}", "ERROR")
     
+    async def _test_backend_endpoint(self, backend_url: str, endpoint: str):
+        """Test one endpoint of a custom backend."""
+        test_url = f"{backend_url.rstrip('/')}{endpoint}"
+        self._emit(f"\n  Testing endpoint: {endpoint}")
+        success, info, error = await self.test_http_connectivity(test_url)
+        
+        if success and info:
+            self.log(f"Endpoint {endpoint}: HTTP {info['status_code']}", "SUCCESS")
+        elif info and info.get('status_code'):
+            self.log(f"Endpoint {endpoint}: HTTP {info['status_code']}", "WARNING")
+        else:
+            self.log(f"Endpoint {endpoint}: Failed", "ERROR")
+    
+    async def run(self, backend_url: Optional[str] = None) -> Dict:
+        """Test all standard services and an optional custom backend, returning the final summary."""
+        # One connection pool for the whole run: the custom backend's endpoint probes
+        # reuse the keep-alive connection (and TLS session) of its base URL probe
+        # Its resolver answers from the DNS test results, so hosts are not looked up twice
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=16,
+            keepalive_timeout=60,
+            resolver=CachedResolver(self._dns_cache)
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            # A total timeout bounds each request once, including any redirects it follows
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+            self.session = session
+            self._resolver = aiodns.DNSResolver() if aiodns is not None else None
+            
+            # Test all standard services
+            await self.test_all_services()
+            
+            # Test custom backend if provided
+            if backend_url:
+                await self.test_custom_backend(backend_url)
+        
+        # Generate final summary
+        return self.generate_summary()
+    
     def generate_summary(self):
         """Generate and display test summary."""
-        print(f"\n{Colors.BOLD}{Colors.BLUE}📊 Network Connectivity Summary{Colors.END}")
-        print(f"{Colors.BOLD}{'='*60}{Colors.END}")
+        c = self.colors
+        lines = [
+            f"\n{c.BOLD}{c.BLUE}📊 Network Connectivity Summary{c.END}",
+            f"{c.BOLD}{'='*60}{c.END}"
+        ]
         
         total_services = len(self.results)
         fully_working = 0
@@ -323,33 +481,36 @@ class NetworkTester:
             else:
                 not_working += 1
         
-        print(f"{Colors.GREEN}✅ Fully Working: {fully_working}/{total_services}{Colors.END}")
-        print(f"{Colors.YELLOW}⚠️  Partially Working: {partially_working}/{total_services}{Colors.END}")
-        print(f"{Colors.RED}❌ Not Working: {not_working}/{total_services}{Colors.END}")
+        lines.append(f"{c.GREEN}✅ Fully Working: {fully_working}/{total_services}{c.END}")
+        lines.append(f"{c.YELLOW}⚠️  Partially Working: {partially_working}/{total_services}{c.END}")
+        lines.append(f"{c.RED}❌ Not Working: {not_working}/{total_services}{c.END}")
         
         if not_working > 0:
-            print(f"\n{Colors.RED}{Colors.BOLD}Services with Issues:{Colors.END}")
+            lines.append(f"\n{c.RED}{c.BOLD}Services with Issues:{c.END}")
             for result in self.results:
                 if not result["dns_success"] or not result["port_success"]:
-                    print(f"{Colors.RED}  ❌ {result['service']}{Colors.END}")
+                    lines.append(f"{c.RED}  ❌ {result['service']}{c.END}")
                     for error in result["errors"]:
-                        print(f"     {error}")
+                        lines.append(f"     {error}")
         
         # Recommendations
-        print(f"\n{Colors.BOLD}🔧 Recommendations:{Colors.END}")
+        lines.append(f"\n{c.BOLD}🔧 Recommendations:{c.END}")
         
         if not_working == 0 and partially_working == 0:
-            print(f"{Colors.GREEN}  ✨ All services are fully accessible!{Colors.END}")
-            print(f"{Colors.GREEN}  ✨ Your network configuration looks good for deployment.{Colors.END}")
+            lines.append(f"{c.GREEN}  ✨ All services are fully accessible!{c.END}")
+            lines.append(f"{c.GREEN}  ✨ Your network configuration looks good for deployment.{c.END}")
         else:
-            print(f"{Colors.YELLOW}  🔍 Check your internet connection and firewall settings{Colors.END}")
-            print(f"{Colors.YELLOW}  🔍 Verify that ports 443 (HTTPS) and 80 (HTTP) are not blocked{Colors.END}")
+            lines.append(f"{c.YELLOW}  🔍 Check your internet connection and firewall settings{c.END}")
+            lines.append(f"{c.YELLOW}  🔍 Verify that ports 443 (HTTPS) and 80 (HTTP) are not blocked{c.END}")
             
             if any(not result["dns_success"] for result in self.results):
-                print(f"{Colors.YELLOW}  🔍 DNS issues detected - check your DNS server configuration{Colors.END}")
+                lines.append(f"{c.YELLOW}  🔍 DNS issues detected - check your DNS server configuration{c.END}")
             
             if any(not result["port_success"] for result in self.results if result["dns_success"]):
-                print(f"{Colors.YELLOW}  🔍 Port connectivity issues - check firewall and proxy settings{Colors.END}")
+                lines.append(f"{c.YELLOW}  🔍 Port connectivity issues - check firewall and proxy settings{c.END}")
+        
+        # Written in one go rather than a print call per line
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return {
             "total_services": total_services,
@@ -370,31 +531,24 @@ def main():
     
     # Create network tester
     tester = NetworkTester(timeout=args.timeout, verbose=args.verbose)
+    c = tester.colors
     
     try:
-        # Test all standard services
-        tester.test_all_services()
-        
-        # Test custom backend if provided
-        if args.backend_url:
-            tester.test_custom_backend(args.backend_url)
-        
-        # Generate final summary
-        summary = tester.generate_summary()
+        summary = asyncio.run(tester.run(args.backend_url))
         
         # Exit with appropriate code
         if summary["not_working"] == 0:
-            print(f"\n{Colors.GREEN}🎉 All network connectivity tests passed!{Colors.END}")
+            print(f"\n{c.GREEN}🎉 All network connectivity tests passed!{c.END}")
             sys.exit(0)
         else:
-            print(f"\n{Colors.RED}⚠️  Some network connectivity issues detected.{Colors.END}")
+            print(f"\n{c.RED}⚠️  Some network connectivity issues detected.{c.END}")
             sys.exit(1)
     
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Network tests interrupted by user{Colors.END}")
+        print(f"\n{c.YELLOW}Network tests interrupted by user{c.END}")
         sys.exit(1)
     except Exception as e:
-        print(f"\n{Colors.RED}Network tests failed with error: {str(e)}{Colors.END}")
+        print(f"\n{c.RED}Network tests failed with error: {str(e)}{c.END}")
         if args.verbose:
             import traceback
             traceback.print_exc()